@@ -1,4 +1,5 @@
 import time
+from collections import deque
 import numpy as np
 import sounddevice as sd
 import queue
@@ -25,54 +26,69 @@ from src.llm.phi4_mini_llm import Phi4MiniLLM
 from src.rag.memory_store import add_to_knowledge_base, retrieve_context
 from src.tool_calls import ToolManager
 
+# Chat-history log layout
+_LOG_RULE = "=" * 60 + "\n"
+_LOG_DIVIDER = "-" * 40 + "\n"
+# Memory updates written between explicit flushes of the log file
+_LOG_FLUSH_EVERY = 10
+
 # --- Conversation Memory Class ---
 class ConversationMemory:
     """Simple conversation memory to track recent chat history"""
     
     def __init__(self, max_turns=5, log_file="memory/chat_history.txt"):
         self.max_turns = max_turns
-        self.turns = []  # List of {"user": str, "assistant": str} dicts
+        # {"user": str, "assistant": str} dicts; the oldest falls off past max_turns
+        self.turns = deque(maxlen=max_turns) if max_turns > 0 else deque()
         self.log_file = log_file
+        self._log = None  # Open log handle, kept for the whole session
+        self._unflushed = 0
         
         # Initialize log file with header
         self._write_log_header()
     
     def _write_log_header(self):
-        """Write header to the log file"""
+        """Write header to the log file and keep it open for appending"""
         import os
         from datetime import datetime
         
         # Create memory directory if it doesn't exist
         os.makedirs(os.path.dirname(self.log_file), exist_ok=True)
         
-        with open(self.log_file, 'w', encoding='utf-8') as f:
-            f.write("=" * 60 + "\n")
-            f.write("VOICE ASSISTANT CHAT HISTORY LOG\n")
-            f.write(f"Session started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("=" * 60 + "\n\n")
+        self._log = open(self.log_file, 'w', encoding='utf-8', buffering=1 << 16)
+        self._log.write(_LOG_RULE)
+        self._log.write("VOICE ASSISTANT CHAT HISTORY LOG\n")
+        self._log.write(f"Session started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        self._log.write(_LOG_RULE + "\n")
+        self._log.flush()
+    
+    def _write_log(self, text):
+        """Append to the log, flushing to disk every _LOG_FLUSH_EVERY writes"""
+        self._log.write(text)
+        self._unflushed += 1
+        if self._unflushed >= _LOG_FLUSH_EVERY:
+            self._log.flush()
+            self._unflushed = 0
     
     def _update_log_file(self):
         """Update the entire log file with current conversation history"""
         from datetime import datetime
         
+        parts = [
+            f"\n[{datetime.now().strftime('%H:%M:%S')}] CONVERSATION MEMORY UPDATE\n",
+            f"Total turns stored: {len(self.turns)}/{self.max_turns}\n",
+            _LOG_DIVIDER,
+        ]
+        if not self.turns:
+            parts.append("(No conversation history yet)\n")
+        else:
+            for i, turn in enumerate(self.turns, 1):
+                parts.append(f"Turn {i}:\n  User: {turn['user']}\n  Assistant: {turn['assistant']}\n\n")
+        parts.append(_LOG_DIVIDER)
+        parts.append("END OF MEMORY UPDATE\n\n")
+        
         try:
-            with open(self.log_file, 'a', encoding='utf-8') as f:
-                f.write(f"\n[{datetime.now().strftime('%H:%M:%S')}] CONVERSATION MEMORY UPDATE\n")
-                f.write(f"Total turns stored: {len(self.turns)}/{self.max_turns}\n")
-                f.write("-" * 40 + "\n")
-                
-                if not self.turns:
-                    f.write("(No conversation history yet)\n")
-                else:
-                    for i, turn in enumerate(self.turns, 1):
-                        f.write(f"Turn {i}:\n")
-                        f.write(f"  User: {turn['user']}\n")
-                        f.write(f"  Assistant: {turn['assistant']}\n")
-                        f.write("\n")
-                
-                f.write("-" * 40 + "\n")
-                f.write("END OF MEMORY UPDATE\n\n")
-                f.flush()  # Force write to disk immediately
+            self._write_log("".join(parts))
         except Exception as e:
             print(f"Warning: Could not update chat history log: {e}")
     
@@ -83,9 +99,6 @@ class ConversationMemory:
                 "user": user_message,
                 "assistant": assistant_response
             })
-            # Keep only the last max_turns
-            if len(self.turns) > self.max_turns:
-                self.turns.pop(0)
             
             # Log the update to file
             self._update_log_file()
@@ -104,20 +117,30 @@ class ConversationMemory:
     
     def clear(self):
         """Clear conversation memory"""
-        self.turns = []
+        self.turns.clear()
         # Log the memory clear
         from datetime import datetime
         try:
-            with open(self.log_file, 'a', encoding='utf-8') as f:
-                f.write(f"\n[{datetime.now().strftime('%H:%M:%S')}] MEMORY CLEARED\n")
-                f.write("All conversation history has been reset.\n\n")
-                f.flush()
+            self._write_log(f"\n[{datetime.now().strftime('%H:%M:%S')}] MEMORY CLEARED\n"
+                            "All conversation history has been reset.\n\n")
         except Exception as e:
             print(f"Warning: Could not log memory clear: {e}")
     
     def get_turn_count(self):
         """Get number of stored turns"""
         return len(self.turns)
+    
+    def close(self):
+        """Flush and close the chat history log"""
+        if self._log is not None and not self._log.closed:
+            self._log.close()
+    
+    def __del__(self):
+        """Destructor to ensure the log is flushed"""
+        try:
+            self.close()
+        except Exception:
+            pass
 
 # --- Constants ---
 DEFAULT_CONFIG_PATH = "configs/config.yaml"
@@ -404,7 +427,8 @@ class VoiceAssistant:
             
             # Auto-reset if we detect repetitive refusal patterns
             if len(self.conversation_memory.turns) >= 2:
-                recent_responses = [turn["assistant"] for turn in self.conversation_memory.turns[-2:]]
+                turns = self.conversation_memory.turns
+                recent_responses = (turns[-2]["assistant"], turns[-1]["assistant"])
                 if all("I'm sorry, but I can't provide information" in response for response in recent_responses):
                     self.console.print("[bold yellow]Detected repetitive refusals - clearing memory to reset context[/bold yellow]")
                     self.conversation_memory.clear()
@@ -590,6 +614,9 @@ class VoiceAssistant:
                 
                 stream.stop()
                 stream.close()
+                
+                # Flush the chat history log
+                self.conversation_memory.close()
 
 def main():
     """
@@ -1,11 +1,12 @@
 from .calculator import Calculator
 from .weather import WeatherChecker
-from .google_calendar import GoogleCalendarManager
+from .google_calendar import GoogleCalendarManager, AsyncGoogleCalendarManager
 from .tool_manager import ToolManager
 
 __all__ = [
     'Calculator',
     'WeatherChecker', 
     'GoogleCalendarManager',
+    'AsyncGoogleCalendarManager',
     'ToolManager',
 ] 
\ No newline at end of file
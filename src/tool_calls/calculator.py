@@ -1,45 +1,85 @@
 import math
 import json
 import re
+import functools
 from typing import Dict, Any
 import sympy as sp
-from sympy.parsing.sympy_parser import parse_expr, standard_transformations, implicit_multiplication_application
+from sympy.core.function import AppliedUndef
+from sympy.parsing.sympy_parser import (parse_expr, standard_transformations, implicit_multiplication_application,
+                                        convert_xor)
+
+
+@functools.lru_cache(maxsize=32)
+def _sym(name: str) -> sp.Symbol:
+    """Return a cached SymPy symbol for the given variable name"""
+    return sp.Symbol(name)
+
+
+# Only needed for inputs the preprocessor could not normalize; convert_xor keeps
+# '^' as power, as sympify does on the first path
+_TRANSFORMS = standard_transformations + (implicit_multiplication_application, convert_xor)
+
+# Words that mark a natural-language description rather than a formula.
+# On their own they are valid variable names ('area*2', 'volume - 10'), so only
+# reject them in a phrase: followed by 'of'/'with', or among several words
+# with no operator between them ('area circle').
+_NL_WORDS = frozenset({"perimeter", "area", "circumference", "volume"})
+_NL_PHRASE_RE = re.compile(r'\b(?:perimeter|area|circumference|volume)\s+(?:of|with)\b', re.IGNORECASE)
+_OPERATOR_RE = re.compile(r'[-+*/^()=!,]')
+
+_NL_HINT = "Please use mathematical formulas instead of natural language. For example: 'perimeter of circle' → '2*pi*r', 'area of circle' → 'pi*r^2', 'area of rectangle' → 'length*width'"
+
+
+# Static tool schema, built once at import
+_TOOL_INFO = {
+    "name": "calculator",
+    "description": "Perform mathematical calculations using mathematical expressions and formulas. IMPORTANT: Only use mathematical notation, NOT natural language descriptions. Examples: '2*pi*r' not 'perimeter of circle', 'pi*r^2' not 'area of circle', '7!' not 'factorial of 7'.",
+    "parameters": {
+        "type": "object",
+        "properties": {
+            "expression": {
+                "type": "string",
+                "description": "Mathematical expression using proper mathematical notation. Use: +, -, *, /, ^, sqrt(), sin(), cos(), tan(), log(), pi, e, factorial(). Examples: '2*pi*7' (perimeter), 'pi*7^2' (area), '7!/2!' (factorial division), 'sqrt(144)', 'sin(pi/2)', etc. DO NOT use natural language like 'perimeter of circle' - use the actual formula like '2*pi*r'."
+            },
+            "mode": {
+                "type": "string",
+                "description": "Calculation mode",
+                "enum": ["evaluate", "simplify", "expand", "factor", "solve", "integrate", "differentiate", "limit"],
+                "default": "evaluate"
+            },
+            "variable": {
+                "type": "string",
+                "description": "Variable for calculus operations (default: x)",
+                "default": "x"
+            }
+        },
+        "required": ["expression"]
+    }
+}
+
+
+class NaturalLanguageError(ValueError):
+    """Raised when an expression is a natural-language description instead of a formula"""
+
 
 class Calculator:
     """Enhanced calculator tool for complex mathematical operations"""
     
     @staticmethod
     def get_tool_info() -> Dict[str, Any]:
-        """Get tool information for LLM"""
-        return {
-            "name": "calculator",
-            "description": "Perform mathematical calculations using mathematical expressions and formulas. IMPORTANT: Only use mathematical notation, NOT natural language descriptions. Examples: '2*pi*r' not 'perimeter of circle', 'pi*r^2' not 'area of circle', '7!' not 'factorial of 7'.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "expression": {
-                        "type": "string",
-                        "description": "Mathematical expression using proper mathematical notation. Use: +, -, *, /, ^, sqrt(), sin(), cos(), tan(), log(), pi, e, factorial(). Examples: '2*pi*7' (perimeter), 'pi*7^2' (area), '7!/2!' (factorial division), 'sqrt(144)', 'sin(pi/2)', etc. DO NOT use natural language like 'perimeter of circle' - use the actual formula like '2*pi*r'."
-                    },
-                    "mode": {
-                        "type": "string",
-                        "description": "Calculation mode",
-                        "enum": ["evaluate", "simplify", "expand", "factor", "solve", "integrate", "differentiate", "limit"],
-                        "default": "evaluate"
-                    },
-                    "variable": {
-                        "type": "string",
-                        "description": "Variable for calculus operations (default: x)",
-                        "default": "x"
-                    }
-                },
-                "required": ["expression"]
-            }
-        }
+        """Get tool information for LLM (shared schema dict - do not mutate)"""
+        return _TOOL_INFO
     
     @staticmethod
     def _preprocess_expression(expr_str: str) -> str:
         """Preprocess expression to handle common mathematical notation"""
+        # Reject natural-language descriptions before SymPy ever sees them
+        if _NL_PHRASE_RE.search(expr_str):
+            raise NaturalLanguageError(expr_str)
+        words = expr_str.lower().split()
+        if len(words) > 1 and _NL_WORDS.intersection(words) and not _OPERATOR_RE.search(expr_str):
+            raise NaturalLanguageError(expr_str)
+        
         # Handle factorial notation
         expr_str = re.sub(r'(\d+)!', r'factorial(\1)', expr_str)
         expr_str = re.sub(r'(\w+)!', r'factorial(\1)', expr_str)
@@ -100,136 +140,157 @@ class Calculator:
                 return expr
     
     @staticmethod
-    def execute(expression: str, mode: str = "evaluate", variable: str = "x") -> Dict[str, Any]:
-        """Execute calculator operation"""
+    def execute(expression: str, mode: str = "evaluate", variable: str = "x",
+                verbose: bool = True) -> Dict[str, Any]:
+        """Execute calculator operation (verbose=False skips the "calculation" string)"""
         try:
             # Preprocess the expression
             preprocessed_expr = Calculator._preprocess_expression(expression.strip())
             
             # Parse the expression using sympy
-            transformations = standard_transformations + (implicit_multiplication_application,)
-            
             try:
-                # Parse expression
-                parsed_expr = parse_expr(preprocessed_expr, transformations=transformations)
-            except Exception as e:
-                # Fallback: try with basic parsing
+                # Preprocessing already inserts explicit '*', so the cheap
+                # sympify path handles well-formed input
+                parsed_expr = sp.sympify(preprocessed_expr)
+            except (sp.SympifyError, SyntaxError):
+                parsed_expr = None
+            
+            # sympify reads 'x(x+1)' as a call to an undefined function x;
+            # implicit multiplication gives the intended x*(x+1)
+            if parsed_expr is None or (isinstance(parsed_expr, sp.Basic)
+                                       and parsed_expr.atoms(AppliedUndef)):
+                # Fallback: tokenizer-based parsing with implicit multiplication
                 try:
-                    parsed_expr = sp.sympify(preprocessed_expr)
+                    parsed_expr = parse_expr(preprocessed_expr, transformations=_TRANSFORMS)
                 except Exception as e2:
-                    error_msg = str(e2).lower()
-                    if any(word in error_msg for word in ['perimeter', 'area', 'circumference', 'volume']):
-                        return {"error": f"Please use mathematical formulas instead of natural language. For example: 'perimeter of circle' → '2*pi*r', 'area of circle' → 'pi*r^2', 'area of rectangle' → 'length*width'"}
-                    else:
-                        return {"error": f"Could not parse expression '{expression}': {str(e2)}. Please use mathematical notation like '2*pi*5' instead of 'perimeter of circle with radius 5'."}
+                    return {"error": f"Could not parse expression '{expression}': {str(e2)}. Please use mathematical notation like '2*pi*5' instead of 'perimeter of circle with radius 5'."}
             
             # Handle different modes
             if mode == "evaluate":
                 result = Calculator._safe_evaluate(parsed_expr)
                 
-                # Format result appropriately
-                if isinstance(result, (int, float)):
-                    if result == int(result):
+                # Format result appropriately - exact type check keeps SymPy
+                # objects out of the numeric path (no symbolic __eq__ dispatch)
+                if type(result) is float:
+                    if result.is_integer():
                         formatted_result = str(int(result))
                     else:
                         formatted_result = f"{result:.10g}"  # Remove trailing zeros
                 else:
                     formatted_result = str(result)
                 
-                return {
+                output = {
                     "result": result,
                     "formatted_result": formatted_result,
-                    "calculation": f"{expression} = {formatted_result}",
                     "original_expression": expression,
                     "parsed_expression": str(parsed_expr)
                 }
+                if verbose:
+                    output["calculation"] = f"{expression} = {formatted_result}"
+                return output
             
             elif mode == "simplify":
                 simplified = sp.simplify(parsed_expr)
-                return {
+                output = {
                     "result": simplified,
                     "formatted_result": str(simplified),
-                    "calculation": f"Simplified: {expression} = {simplified}",
                     "original_expression": expression
                 }
+                if verbose:
+                    output["calculation"] = f"Simplified: {expression} = {simplified}"
+                return output
             
             elif mode == "expand":
                 expanded = sp.expand(parsed_expr)
-                return {
+                output = {
                     "result": expanded,
                     "formatted_result": str(expanded),
-                    "calculation": f"Expanded: {expression} = {expanded}",
                     "original_expression": expression
                 }
+                if verbose:
+                    output["calculation"] = f"Expanded: {expression} = {expanded}"
+                return output
             
             elif mode == "factor":
                 factored = sp.factor(parsed_expr)
-                return {
+                output = {
                     "result": factored,
                     "formatted_result": str(factored),
-                    "calculation": f"Factored: {expression} = {factored}",
                     "original_expression": expression
                 }
+                if verbose:
+                    output["calculation"] = f"Factored: {expression} = {factored}"
+                return output
             
             elif mode == "solve":
-                var = sp.Symbol(variable)
+                var = _sym(variable)
                 solutions = sp.solve(parsed_expr, var)
                 solutions_str = [str(sol) for sol in solutions]
-                return {
+                output = {
                     "result": solutions,
                     "formatted_result": ", ".join(solutions_str) if solutions_str else "No solutions",
-                    "calculation": f"Solutions for {expression} = 0: {', '.join(solutions_str) if solutions_str else 'No solutions'}",
                     "original_expression": expression,
                     "variable": variable
                 }
+                if verbose:
+                    output["calculation"] = f"Solutions for {expression} = 0: {', '.join(solutions_str) if solutions_str else 'No solutions'}"
+                return output
             
             elif mode == "integrate":
-                var = sp.Symbol(variable)
+                var = _sym(variable)
                 try:
                     integral = sp.integrate(parsed_expr, var)
-                    return {
+                    output = {
                         "result": integral,
                         "formatted_result": str(integral) + " + C",
-                        "calculation": f"∫({expression}) d{variable} = {integral} + C",
                         "original_expression": expression,
                         "variable": variable
                     }
+                    if verbose:
+                        output["calculation"] = f"∫({expression}) d{variable} = {integral} + C"
+                    return output
                 except Exception as e:
                     return {"error": f"Could not integrate expression: {str(e)}"}
             
             elif mode == "differentiate":
-                var = sp.Symbol(variable)
+                var = _sym(variable)
                 try:
                     derivative = sp.diff(parsed_expr, var)
-                    return {
+                    output = {
                         "result": derivative,
                         "formatted_result": str(derivative),
-                        "calculation": f"d/d{variable}({expression}) = {derivative}",
                         "original_expression": expression,
                         "variable": variable
                     }
+                    if verbose:
+                        output["calculation"] = f"d/d{variable}({expression}) = {derivative}"
+                    return output
                 except Exception as e:
                     return {"error": f"Could not differentiate expression: {str(e)}"}
             
             elif mode == "limit":
-                var = sp.Symbol(variable)
+                var = _sym(variable)
                 try:
                     # For limit, we need to specify approach point
                     # Default to 0 if not specified in expression
                     limit_result = sp.limit(parsed_expr, var, 0)
-                    return {
+                    output = {
                         "result": limit_result,
                         "formatted_result": str(limit_result),
-                        "calculation": f"lim({variable}→0) {expression} = {limit_result}",
                         "original_expression": expression,
                         "variable": variable
                     }
+                    if verbose:
+                        output["calculation"] = f"lim({variable}→0) {expression} = {limit_result}"
+                    return output
                 except Exception as e:
                     return {"error": f"Could not compute limit: {str(e)}"}
             
             else:
                 return {"error": f"Unknown mode: {mode}"}
                 
+        except NaturalLanguageError:
+            return {"error": _NL_HINT}
         except Exception as e:
             return {"error": f"Calculation error: {str(e)}"}
     
@@ -248,9 +309,8 @@ class Calculator:
             "simplify((x^2 - 1)/(x - 1))"
         ]
         
-        results = {}
-        for expr in test_cases:
-            result = Calculator.execute(expr)
-            results[expr] = result
+        # Sequential on purpose: worker processes would each re-import SymPy,
+        # which costs more than these nine evaluations
+        results = {expr: Calculator.execute(expr) for expr in test_cases}
         
         return results 
\ No newline at end of file
@@ -1,7 +1,19 @@
 import os
+import re
+import copy
+import asyncio
 import json
+import time
+import hashlib
+import logging
+import platform
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, time as dtime
+
+import numpy as np
 
 # Optional Google Calendar imports - graceful degradation if not available
 try:
@@ -9,13 +21,305 @@ try:
     from google.oauth2.credentials import Credentials
     from google.auth.transport.requests import Request
     from google_auth_oauthlib.flow import InstalledAppFlow
+    import httplib2
+    import google_auth_httplib2
     from googleapiclient.discovery import build
     from googleapiclient.errors import HttpError
+    from googleapiclient.model import JsonModel
     GOOGLE_CALENDAR_AVAILABLE = True
 except ImportError as e:
     GOOGLE_CALENDAR_AVAILABLE = False
     _missing_import = str(e)
 
+logger = logging.getLogger(__name__)
+
+# Optional: tzlocal reports the real IANA zone instead of an abbreviation
+try:
+    from tzlocal import get_localzone_name
+except ImportError:
+    get_localzone_name = None
+
+
+# Optional: ciso8601 parses the API's RFC 3339 timestamps (including 'Z') in C
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    def _parse_iso(value: str) -> datetime:
+        """Parse an RFC 3339 timestamp from the API"""
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+# Optional: orjson speeds up request/response body (de)serialization
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if GOOGLE_CALENDAR_AVAILABLE and orjson is not None:
+    class _OrjsonModel(JsonModel):
+        """JsonModel that encodes and decodes API bodies with orjson"""
+        
+        def serialize(self, body_value):
+            if isinstance(body_value, dict) and "data" not in body_value and self._data_wrapper:
+                body_value = {"data": body_value}
+            return orjson.dumps(body_value).decode()
+        
+        def deserialize(self, content):
+            try:
+                body = orjson.loads(content)
+            except orjson.JSONDecodeError:
+                return content.decode('utf-8') if isinstance(content, bytes) else content
+            if self._data_wrapper and "data" in body:
+                body = body["data"]
+            return body
+    
+    _API_MODEL = _OrjsonModel()
+else:
+    _API_MODEL = None  # build() falls back to the stdlib-json JsonModel
+
+
+def _detect_local_tz():
+    """Detect the system timezone once, falling back to UTC"""
+    local_tz_name = None
+    if get_localzone_name is not None:
+        try:
+            local_tz_name = get_localzone_name()
+        except Exception:  # tzlocal raises when the system zone is misconfigured
+            pass
+    if local_tz_name is None and platform.system() != 'Windows':  # Windows falls back to UTC
+        local_tz_name = time.tzname[0] if not time.daylight else time.tzname[1]
+    
+    # Validate against the known zone names instead of catching lookup errors
+    if local_tz_name in pytz.all_timezones_set:
+        return pytz.timezone(local_tz_name)
+    return pytz.UTC
+
+
+@functools.lru_cache(maxsize=64)
+def _get_timezone(name: str):
+    """Cached pytz.timezone lookup for user-supplied zone names"""
+    return pytz.timezone(name)
+
+
+_LOCAL_TZ = _detect_local_tz() if GOOGLE_CALENDAR_AVAILABLE else None
+_LOCAL_TZ_NAME = _LOCAL_TZ.zone if _LOCAL_TZ is not None else None
+
+# Date/time grammars accepted by _parse_date/_parse_time, matched in one pass
+_SIMPLE_DATES = {'today': 0, 'now': 0, 'tomorrow': 1, 'yesterday': -1}
+_NEXT_RE = re.compile(r'^next (\w+)$')
+_DATE_RE = re.compile(
+    r'^(?:(?P<iso_y>\d{4})-(?P<iso_m>\d{1,2})-(?P<iso_d>\d{1,2})'
+    r'|(?P<sl_a>\d{1,2})/(?P<sl_b>\d{1,2})/(?P<sl_y>\d{4})'
+    r'|(?P<us_m>\d{1,2})-(?P<us_d>\d{1,2})-(?P<us_y>\d{4}))$'
+)
+_WEEKDAYS = {
+    'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
+    'friday': 4, 'saturday': 5, 'sunday': 6
+}
+_TIME_RE = re.compile(r'^(\d{1,2})(?::(\d{2}))?(?::\d{2})?\s*(am|pm)?$')
+
+
+def _make_date(year: int, month: int, day: int) -> Optional[datetime]:
+    try:
+        return datetime(year, month, day)
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_absolute_date(date_str: str) -> Optional[datetime]:
+    """Parse YYYY-MM-DD, MM/DD/YYYY, DD/MM/YYYY or MM-DD-YYYY; None if no match"""
+    match = _DATE_RE.match(date_str)
+    if not match:
+        return None
+    g = match.groupdict()
+    if g['iso_y']:
+        return _make_date(int(g['iso_y']), int(g['iso_m']), int(g['iso_d']))
+    if g['sl_y']:
+        # Month-first, falling back to day-first when that is not a valid date
+        year, a, b = int(g['sl_y']), int(g['sl_a']), int(g['sl_b'])
+        return _make_date(year, a, b) or _make_date(year, b, a)
+    return _make_date(int(g['us_y']), int(g['us_m']), int(g['us_d']))
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_time_str(time_str: str) -> tuple:
+    """Parse a normalized (lowercase, stripped) time string into (hour, minute)"""
+    match = _TIME_RE.match(time_str)
+    if not match:
+        raise ValueError(f"Unrecognized time: {time_str}")
+    hour = int(match.group(1))
+    minute = int(match.group(2) or 0)
+    meridiem = match.group(3)
+    
+    if meridiem == 'pm' and hour != 12:
+        hour += 12
+    elif meridiem == 'am' and hour == 12:
+        hour = 0
+    
+    return (hour, minute)
+
+
+def _clock(timestamp: int, tz) -> str:
+    """Format an epoch timestamp as HH:MM wall-clock time in tz"""
+    local = datetime.fromtimestamp(timestamp, tz)
+    return f"{local.hour:02d}:{local.minute:02d}"
+
+# Maximum sub-requests per Calendar API batch call
+_BATCH_LIMIT = 50
+
+# Socket timeout (seconds) for Calendar API connections
+_HTTP_TIMEOUT = 30
+
+# Worker threads for running independent API requests concurrently
+_POOL_WORKERS = 8
+
+# Partial-response masks: only request the fields the formatters read
+_LIST_FIELDS = "items(id,summary,start,end,location,description,attendees/email,htmlLink),nextPageToken"
+_EVENT_FIELDS = ("id,summary,description,location,start,end,attendees(email,responseStatus,optional),"
+                 "creator/email,htmlLink,status")
+_CALENDAR_FIELDS = "items(id,summary,description,primary,accessRole)"
+_BUSY_FIELDS = "items(start/dateTime,end/dateTime)"
+
+# Seconds that list_events / find_free_time / list_calendars results stay valid in memory
+_LIST_TTL = 30.0
+_CALENDARS_TTL = 600.0
+
+# Refresh access tokens this long before they expire
+_TOKEN_REFRESH_MARGIN = timedelta(seconds=60)
+
+
+# Static tool schema, built once at import
+_TOOL_INFO = {
+    "name": "google_calendar",
+    "description": "Manage Google Calendar events including creating, viewing, updating, and deleting appointments",
+    "parameters": {
+        "type": "object",
+        "properties": {
+            "action": {
+                "type": "string",
+                "description": "Calendar action to perform",
+                "enum": ["create_event", "list_events", "update_event", "delete_event", 
+                        "find_free_time", "get_event_details", "list_calendars", "batch"]
+            },
+            "title": {
+                "type": "string",
+                "description": "Event title or summary"
+            },
+            "date": {
+                "type": "string",
+                "description": "Event date in YYYY-MM-DD format or natural language like 'today', 'tomorrow', 'next Monday'. For list_events, this sets both start and end date to the same day."
+            },
+            "time": {
+                "type": "string",
+                "description": "Event start time in HH:MM format (24-hour) or natural language like '2 PM', '9:30 AM'"
+            },
+            "end_time": {
+                "type": "string",
+                "description": "Event end time in HH:MM format (24-hour) or natural language"
+            },
+            "duration": {
+                "type": "integer",
+                "description": "Event duration in minutes (default: 60)"
+            },
+            "description": {
+                "type": "string",
+                "description": "Event description or notes"
+            },
+            "location": {
+                "type": "string",
+                "description": "Event location or address"
+            },
+            "attendees": {
+                "type": "string",
+                "description": "Comma-separated list of attendee email addresses"
+            },
+            "event_id": {
+                "type": "string",
+                "description": "Google Calendar event ID for update/delete operations"
+            },
+            "calendar_ids": {
+                "type": "string",
+                "description": "Comma-separated calendar IDs checked together for find_free_time (busy in any counts as busy)"
+            },
+            "event_ids": {
+                "type": "string",
+                "description": "Comma-separated event IDs to fetch in one request (get_event_details)"
+            },
+            "operations": {
+                "type": "array",
+                "description": "For action 'batch': list of operations, each an object with 'action' (create_event, update_event, delete_event or get_event_details), an optional 'client_id' and that action's parameters"
+            },
+            "start_date": {
+                "type": "string",
+                "description": "Start date for listing events (YYYY-MM-DD) or natural language"
+            },
+            "end_date": {
+                "type": "string",
+                "description": "End date for listing events (YYYY-MM-DD) or natural language"
+            },
+            "max_results": {
+                "type": "integer",
+                "description": "Maximum number of events to return (default: 10)"
+            },
+            "calendar_id": {
+                "type": "string",
+                "description": "Calendar ID (default: 'primary' for main calendar)"
+            },
+            "timezone": {
+                "type": "string",
+                "description": "Timezone (default: system timezone)"
+            }
+        },
+        "required": ["action"]
+    }
+}
+
+
+class _TokenCache:
+    """Thread-safe store of live OAuth credentials shared across managers"""
+    
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._creds: Dict[str, Any] = {}
+    
+    @staticmethod
+    def key_for(creds) -> str:
+        """Hash the identity of a credential set (client, secret, refresh token, scopes)"""
+        ident = (creds.client_id, creds.client_secret, creds.refresh_token,
+                 tuple(creds.scopes or ()))
+        return hashlib.sha256(repr(ident).encode()).hexdigest()
+    
+    def get(self, key: str):
+        with self._lock:
+            return self._creds.get(key)
+    
+    def put(self, creds) -> str:
+        key = self.key_for(creds)
+        with self._lock:
+            # Keep the first instance so every manager shares one token
+            self._creds.setdefault(key, creds)
+        return key
+    
+    def ensure_fresh(self, creds) -> bool:
+        """Refresh creds once if the access token is about to expire; True if refreshed"""
+        with self._lock:
+            if not creds.refresh_token or not creds.expiry:
+                return False
+            if creds.expiry - datetime.utcnow() > _TOKEN_REFRESH_MARGIN:
+                return False
+            creds.refresh(Request())
+            return True
+
+
+_TOKEN_CACHE = _TokenCache()
+
+# Authenticated services shared by every manager in the process, keyed by
+# (client_id, scopes) so build() and token.json are only hit once. Each entry
+# stores the service and the _TOKEN_CACHE key of its credentials.
+_SERVICE_CACHE: Dict[tuple, tuple] = {}
+_CACHE_LOCK = threading.Lock()
+
 class GoogleCalendarManager:
     """Google Calendar integration for the voice assistant"""
     
@@ -32,11 +336,40 @@ class GoogleCalendarManager:
             )
             
         self.service = None
+        self._creds = None
         self.calendar_id = 'primary'  # Default to primary calendar
+        # (cal_id, time_min, time_max, max_results) -> (timestamp, result)
+        self._list_cache: Dict[tuple, tuple] = {}
+        self._calendars_cache: Optional[tuple] = None
+        # Created on first use; each worker thread gets its own Http (httplib2 is not thread-safe)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._local = threading.local()
         self._authenticate()
     
     def _authenticate(self):
-        """Authenticate with Google Calendar API"""
+        """Authenticate with Google Calendar API, reusing a cached service when possible"""
+        cache_key = (os.getenv('GOOGLE_CLIENT_ID'), tuple(self.SCOPES))
+        
+        with _CACHE_LOCK:
+            if cache_key in _SERVICE_CACHE:
+                self.service, token_key = _SERVICE_CACHE[cache_key]
+                self._creds = _TOKEN_CACHE.get(token_key)
+                return
+            
+            creds = self._load_credentials()
+            token_key = _TOKEN_CACHE.put(creds)
+            creds = _TOKEN_CACHE.get(token_key)
+            
+            # The service keeps this authorized Http object, so caching it also
+            # keeps the keep-alive connection alive across managers and calls.
+            # static_discovery uses the discovery document shipped with the library.
+            self.service = build('calendar', 'v3', http=self._authorized_http(creds), model=_API_MODEL,
+                                 cache_discovery=False, static_discovery=True)
+            self._creds = creds
+            _SERVICE_CACHE[cache_key] = (self.service, token_key)
+    
+    def _load_credentials(self):
+        """Load, refresh or create OAuth credentials"""
         creds = None
         
         # Load credentials from environment variables
@@ -45,8 +378,11 @@ class GoogleCalendarManager:
         refresh_token = os.getenv('GOOGLE_REFRESH_TOKEN')
         
         # Check if we have stored credentials
+        stored_json = None
         if os.path.exists('token.json'):
-            creds = Credentials.from_authorized_user_file('token.json', self.SCOPES)
+            with open('token.json', 'r') as token:
+                stored_json = token.read()
+            creds = Credentials.from_authorized_user_info(json.loads(stored_json), self.SCOPES)
         
         # If we have environment variables, create credentials
         if not creds and client_id and client_secret and refresh_token:
@@ -78,90 +414,39 @@ class GoogleCalendarManager:
                 else:
                     raise Exception("No Google Calendar credentials found. Please set up credentials.json or environment variables.")
         
-        # Save the credentials for the next run
+        # Save the credentials for the next run (only if they changed)
         if creds:
-            with open('token.json', 'w') as token:
-                token.write(creds.to_json())
+            new_json = creds.to_json()
+            if new_json != stored_json:
+                self._save_credentials(new_json)
             
-            self.service = build('calendar', 'v3', credentials=creds)
+            return creds
         else:
             raise Exception("Failed to authenticate with Google Calendar")
     
+    @staticmethod
+    def _authorized_http(creds):
+        """Create a keep-alive Http transport that signs requests with creds"""
+        return google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http(timeout=_HTTP_TIMEOUT))
+    
+    @staticmethod
+    def _save_credentials(creds_json: str):
+        """Atomically persist serialized credentials to token.json (owner-only permissions)"""
+        tmp_path = 'token.json.tmp'
+        fd = os.open(tmp_path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as token:
+            token.write(creds_json)
+        os.replace(tmp_path, 'token.json')
+    
+    def _ensure_fresh_token(self):
+        """Refresh the shared access token ahead of expiry and persist it"""
+        if self._creds is not None and _TOKEN_CACHE.ensure_fresh(self._creds):
+            self._save_credentials(self._creds.to_json())
+    
     @staticmethod
     def get_tool_info() -> Dict[str, Any]:
-        """Get tool information for LLM"""
-        return {
-            "name": "google_calendar",
-            "description": "Manage Google Calendar events including creating, viewing, updating, and deleting appointments",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "action": {
-                        "type": "string",
-                        "description": "Calendar action to perform",
-                        "enum": ["create_event", "list_events", "update_event", "delete_event", 
-                                "find_free_time", "get_event_details", "list_calendars"]
-                    },
-                    "title": {
-                        "type": "string",
-                        "description": "Event title or summary"
-                    },
-                    "date": {
-                        "type": "string",
-                        "description": "Event date in YYYY-MM-DD format or natural language like 'today', 'tomorrow', 'next Monday'. For list_events, this sets both start and end date to the same day."
-                    },
-                    "time": {
-                        "type": "string",
-                        "description": "Event start time in HH:MM format (24-hour) or natural language like '2 PM', '9:30 AM'"
-                    },
-                    "end_time": {
-                        "type": "string",
-                        "description": "Event end time in HH:MM format (24-hour) or natural language"
-                    },
-                    "duration": {
-                        "type": "integer",
-                        "description": "Event duration in minutes (default: 60)"
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Event description or notes"
-                    },
-                    "location": {
-                        "type": "string",
-                        "description": "Event location or address"
-                    },
-                    "attendees": {
-                        "type": "string",
-                        "description": "Comma-separated list of attendee email addresses"
-                    },
-                    "event_id": {
-                        "type": "string",
-                        "description": "Google Calendar event ID for update/delete operations"
-                    },
-                    "start_date": {
-                        "type": "string",
-                        "description": "Start date for listing events (YYYY-MM-DD) or natural language"
-                    },
-                    "end_date": {
-                        "type": "string",
-                        "description": "End date for listing events (YYYY-MM-DD) or natural language"
-                    },
-                    "max_results": {
-                        "type": "integer",
-                        "description": "Maximum number of events to return (default: 10)"
-                    },
-                    "calendar_id": {
-                        "type": "string",
-                        "description": "Calendar ID (default: 'primary' for main calendar)"
-                    },
-                    "timezone": {
-                        "type": "string",
-                        "description": "Timezone (default: system timezone)"
-                    }
-                },
-                "required": ["action"]
-            }
-        }
+        """Get tool information for LLM (shared schema dict - do not mutate)"""
+        return _TOOL_INFO
     
     def execute(self, action: str, **kwargs) -> Dict[str, Any]:
         """Execute Google Calendar operation"""
@@ -169,161 +454,254 @@ class GoogleCalendarManager:
             if not self.service:
                 return {"error": "Google Calendar service not initialized"}
             
-            if action == "create_event":
-                return self._create_event(**kwargs)
-            elif action == "list_events":
-                return self._list_events(**kwargs)
-            elif action == "update_event":
-                return self._update_event(**kwargs)
-            elif action == "delete_event":
-                return self._delete_event(**kwargs)
-            elif action == "find_free_time":
-                return self._find_free_time(**kwargs)
-            elif action == "get_event_details":
-                return self._get_event_details(**kwargs)
-            elif action == "list_calendars":
-                return self._list_calendars(**kwargs)
-            else:
+            handler = self._ACTIONS.get(action)
+            if handler is None:
                 return {"error": f"Unknown calendar action: {action}"}
+            
+            self._ensure_fresh_token()
+            
+            return handler(self, **kwargs)
                 
         except HttpError as e:
             return {"error": f"Google Calendar API error: {e}"}
         except Exception as e:
             return {"error": f"Calendar error: {str(e)}"}
     
-    def _parse_date(self, date_str: str) -> datetime:
-        """Parse date string to datetime object"""
+    def execute_batch(self, operations: List[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
+        """Run several create/update/delete/get operations through the Calendar batch endpoint"""
+        if not operations:
+            return {"error": "At least one operation is required for batch"}
+        
+        results = {}
+        pending = []  # (client_id, action, request)
+        written_calendars = set()
+        
+        for index, op in enumerate(operations):
+            op = dict(op)
+            op_action = op.pop("action", None)
+            client_id = str(op.pop("client_id", index))
+            cal_id = op.pop("calendar_id", None) or self.calendar_id
+            
+            try:
+                if op_action == "create_event":
+                    if not op.get("title"):
+                        results[client_id] = {"error": "Event title is required"}
+                        continue
+                    body, _, _ = self._build_event_body(**op)
+                    request = self.service.events().insert(calendarId=cal_id, body=body)
+                elif op_action == "update_event":
+                    event_id = op.pop("event_id", None)
+                    if not event_id:
+                        results[client_id] = {"error": "Event ID is required for updates"}
+                        continue
+                    body = self._build_patch_body(cal_id, event_id, **op)
+                    request = self.service.events().patch(calendarId=cal_id, eventId=event_id, body=body)
+                elif op_action in ("delete_event", "get_event_details"):
+                    event_id = op.get("event_id")
+                    if not event_id:
+                        results[client_id] = {"error": "Event ID is required"}
+                        continue
+                    if op_action == "delete_event":
+                        request = self.service.events().delete(calendarId=cal_id, eventId=event_id)
+                    else:
+                        request = self.service.events().get(calendarId=cal_id, eventId=event_id,
+                                                            fields=_EVENT_FIELDS)
+                else:
+                    results[client_id] = {"error": f"Unsupported batch action: {op_action}"}
+                    continue
+            except Exception as e:
+                results[client_id] = {"error": f"Invalid {op_action} operation: {str(e)}"}
+                continue
+            
+            pending.append((client_id, op_action, request))
+            if op_action != "get_event_details":
+                written_calendars.add(cal_id)
+        
+        outcomes = self._execute_requests([request for _, _, request in pending])
+        
+        for (client_id, op_action, _), (response, exception) in zip(pending, outcomes):
+            if exception is not None:
+                if isinstance(exception, HttpError) and exception.resp.status == 404:
+                    results[client_id] = {"error": "Event not found"}
+                else:
+                    results[client_id] = {"error": f"{op_action} failed: {str(exception)}"}
+            elif op_action in ("create_event", "update_event"):
+                results[client_id] = {
+                    "event_id": response.get('id'),
+                    "event_link": response.get('htmlLink'),
+                    "title": response.get('summary')
+                }
+            elif op_action == "delete_event":
+                results[client_id] = {"deleted": True}
+            else:
+                results[client_id] = {"event": self._format_event_details(response)}
+        
+        for cal_id in written_calendars:
+            self._invalidate_list_cache(cal_id)
+        
+        succeeded = sum(1 for r in results.values() if "error" not in r)
+        return {
+            "action": "batch",
+            "results": results,
+            "count": len(results),
+            "message": f"Batch completed: {succeeded} of {len(results)} operations succeeded"
+        }
+    
+    def _execute_requests(self, requests: List[Any]) -> List[tuple]:
+        """Execute API requests with as few round trips as possible, returning (response, exception) pairs in order"""
+        if len(requests) == 1:
+            try:
+                return [(requests[0].execute(), None)]
+            except Exception as e:
+                return [(None, e)]
+        
+        outcomes: Dict[str, tuple] = {}
+        
+        def _callback(request_id, response, exception):
+            outcomes[request_id] = (response, exception)
+        
+        # The Calendar API accepts a limited number of sub-requests per batch
+        for offset in range(0, len(requests), _BATCH_LIMIT):
+            batch = self.service.new_batch_http_request(callback=_callback)
+            for index in range(offset, min(offset + _BATCH_LIMIT, len(requests))):
+                batch.add(requests[index], request_id=str(index))
+            try:
+                batch.execute()
+            except Exception:
+                # Batch endpoint failed as a whole - issue the remaining requests concurrently
+                remaining = [index for index in range(offset, min(offset + _BATCH_LIMIT, len(requests)))
+                             if str(index) not in outcomes]
+                parallel = self._execute_parallel([requests[index] for index in remaining])
+                for index, outcome in zip(remaining, parallel):
+                    outcomes[str(index)] = outcome
+        
+        return [outcomes[str(index)] for index in range(len(requests))]
+    
+    def _thread_http(self):
+        """Return the calling thread's own authorized Http object"""
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            http = self._local.http = self._authorized_http(self._creds)
+        return http
+    
+    def _execute_parallel(self, requests: List[Any]) -> List[tuple]:
+        """Execute independent API requests on the thread pool, returning (response, exception) pairs"""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=_POOL_WORKERS)
+        
+        def _run(request):
+            try:
+                return request.execute(http=self._thread_http()), None
+            except Exception as e:
+                return None, e
+        
+        return list(self._pool.map(_run, requests))
+    
+    def _invalidate_list_cache(self, cal_id: str):
+        """Drop cached list_events / find_free_time results for a calendar after a write"""
+        for key in [key for key in list(self._list_cache) if key[0] == cal_id]:
+            self._list_cache.pop(key, None)
+    
+    def _parse_date(self, date_str: str, _now: datetime = None) -> datetime:
+        """Parse date string to datetime object (_now lets callers share one clock read)"""
+        today = _now or datetime.now()
         if not date_str:
-            return datetime.now()
+            return today
         
         # Handle natural language dates
-        today = datetime.now()
         date_str = date_str.lower().strip()
         
-        if date_str in ['today', 'now']:
-            return today
-        elif date_str == 'tomorrow':
-            return today + timedelta(days=1)
-        elif date_str == 'yesterday':
-            return today - timedelta(days=1)
-        elif date_str.startswith('next '):
-            day_name = date_str[5:]
-            days_ahead = self._get_days_until_weekday(day_name)
+        offset = _SIMPLE_DATES.get(date_str)
+        if offset is not None:
+            return today + timedelta(days=offset) if offset else today
+        
+        next_match = _NEXT_RE.match(date_str)
+        if next_match:
+            days_ahead = self._get_days_until_weekday(next_match.group(1), today)
             if days_ahead is not None:
                 return today + timedelta(days=days_ahead)
         
-        # Try to parse as YYYY-MM-DD
-        try:
-            return datetime.strptime(date_str, "%Y-%m-%d")
-        except ValueError:
-            pass
-        
-        # Try other common formats
-        formats = ["%m/%d/%Y", "%d/%m/%Y", "%Y-%m-%d", "%m-%d-%Y"]
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
+        # Explicit dates (results cached per string)
+        parsed = _parse_absolute_date(date_str)
         
         # If all else fails, return today
-        return today
+        return parsed if parsed is not None else today
     
     def _parse_time(self, time_str: str) -> tuple:
         """Parse time string and return (hour, minute)"""
         if not time_str:
             return (9, 0)  # Default to 9 AM
         
-        time_str = time_str.lower().strip()
-        
-        # Handle AM/PM format
-        if 'am' in time_str or 'pm' in time_str:
-            is_pm = 'pm' in time_str
-            time_str = time_str.replace('am', '').replace('pm', '').strip()
-            
-            if ':' in time_str:
-                hour, minute = time_str.split(':')
-                hour = int(hour)
-                minute = int(minute)
-            else:
-                hour = int(time_str)
-                minute = 0
-            
-            if is_pm and hour != 12:
-                hour += 12
-            elif not is_pm and hour == 12:
-                hour = 0
-                
-            return (hour, minute)
-        
-        # Handle 24-hour format
-        if ':' in time_str:
-            parts = time_str.split(':')
-            hour = int(parts[0])
-            minute = int(parts[1]) if len(parts) > 1 else 0
-            return (hour, minute)
-        
-        # Single number assumed to be hour
-        hour = int(time_str)
-        return (hour, 0)
-    
-    def _get_days_until_weekday(self, day_name: str) -> Optional[int]:
-        """Get number of days until the specified weekday"""
-        weekdays = {
-            'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
-            'friday': 4, 'saturday': 5, 'sunday': 6
-        }
-        
-        if day_name not in weekdays:
+        return _parse_time_str(time_str.lower().strip())
+    
+    def _get_days_until_weekday(self, day_name: str, _now: datetime = None) -> Optional[int]:
+        """Get number of days until the specified weekday (1-7, never today)"""
+        target = _WEEKDAYS.get(day_name.lower())
+        if target is None:
             return None
         
-        today = datetime.now()
-        days_ahead = weekdays[day_name] - today.weekday()
-        
-        if days_ahead <= 0:  # Target day already happened this week
-            days_ahead += 7
-        
-        return days_ahead
+        return (target - (_now or datetime.now()).weekday() + 6) % 7 + 1
     
-    def _create_datetime(self, date_str: str, time_str: str, timezone_str: str = None) -> datetime:
-        """Create datetime object from date and time strings"""
-        date_obj = self._parse_date(date_str)
+    def _create_datetime(self, date_str: str, time_str: str, timezone_str: str = None,
+                         _now: datetime = None) -> tuple:
+        """Create a localized datetime from date and time strings, returning (dt, IANA tz name)"""
+        date_obj = self._parse_date(date_str, _now)
         hour, minute = self._parse_time(time_str)
         
         # Combine date and time
-        dt = datetime.combine(date_obj.date(), datetime.min.time().replace(hour=hour, minute=minute))
+        dt = datetime.combine(date_obj.date(), dtime(hour, minute))
         
         # Handle timezone - use local timezone by default
         if timezone_str:
             try:
-                tz = pytz.timezone(timezone_str)
-                dt = tz.localize(dt)
-            except:
-                # Default to local timezone
-                import time
-                local_tz_name = time.tzname[0] if not time.daylight else time.tzname[1]
-                try:
-                    local_tz = pytz.timezone(local_tz_name)
-                except:
-                    local_tz = pytz.timezone('UTC')
-                dt = local_tz.localize(dt)
+                tz = _get_timezone(timezone_str)
+                return tz.localize(dt), tz.zone
+            except pytz.UnknownTimeZoneError:
+                pass
+        
+        # Default to local timezone
+        return _LOCAL_TZ.localize(dt), _LOCAL_TZ_NAME
+    
+    def _build_event_body(self, title: str, date: str = None, time: str = None,
+                          end_time: str = None, duration: int = 60, description: str = "",
+                          location: str = "", attendees: str = "", timezone: str = None) -> tuple:
+        """Build an events().insert body, returning (body, start_dt, end_dt)"""
+        # Parse start time
+        now = datetime.now()
+        start_dt, tz_name = self._create_datetime(date or "today", time or "09:00", timezone, now)
+        
+        # Calculate end time
+        if end_time:
+            end_dt, _ = self._create_datetime(date or "today", end_time, timezone, now)
         else:
-            # Use local timezone instead of UTC
-            import time
-            try:
-                # Try to get system timezone
-                import platform
-                if platform.system() == 'Windows':
-                    # For Windows, try to detect timezone
-                    local_tz = pytz.timezone('UTC')  # Fallback to UTC for Windows
-                else:
-                    local_tz_name = time.tzname[0] if not time.daylight else time.tzname[1]
-                    local_tz = pytz.timezone(local_tz_name)
-            except:
-                local_tz = pytz.timezone('UTC')
-            dt = local_tz.localize(dt)
+            end_dt = start_dt + timedelta(minutes=duration)
+        
+        # Parse attendees
+        attendee_list = []
+        if attendees:
+            emails = [email.strip() for email in attendees.split(',')]
+            attendee_list = [{'email': email} for email in emails if email]
+        
+        # Create event object
+        event = {
+            'summary': title,
+            'location': location,
+            'description': description,
+            'start': {
+                'dateTime': start_dt.isoformat(),
+                'timeZone': tz_name,
+            },
+            'end': {
+                'dateTime': end_dt.isoformat(),
+                'timeZone': tz_name,
+            },
+            'attendees': attendee_list,
+            'reminders': {
+                'useDefault': True,
+            },
+        }
         
-        return dt
+        return event, start_dt, end_dt
     
     def _create_event(self, title: str = None, date: str = None, time: str = None,
                      end_time: str = None, duration: int = 60, description: str = "",
@@ -338,42 +716,13 @@ class GoogleCalendarManager:
         cal_id = calendar_id or self.calendar_id
         
         try:
-            # Parse start time
-            start_dt = self._create_datetime(date or "today", time or "09:00", timezone)
-            
-            # Calculate end time
-            if end_time:
-                end_dt = self._create_datetime(date or "today", end_time, timezone)
-            else:
-                end_dt = start_dt + timedelta(minutes=duration)
-            
-            # Parse attendees
-            attendee_list = []
-            if attendees:
-                emails = [email.strip() for email in attendees.split(',')]
-                attendee_list = [{'email': email} for email in emails if email]
-            
-            # Create event object
-            event = {
-                'summary': title,
-                'location': location,
-                'description': description,
-                'start': {
-                    'dateTime': start_dt.isoformat(),
-                    'timeZone': str(start_dt.tzinfo),
-                },
-                'end': {
-                    'dateTime': end_dt.isoformat(),
-                    'timeZone': str(end_dt.tzinfo),
-                },
-                'attendees': attendee_list,
-                'reminders': {
-                    'useDefault': True,
-                },
-            }
+            event, start_dt, end_dt = self._build_event_body(
+                title, date, time, end_time, duration, description, location, attendees, timezone)
+            attendee_list = event['attendees']
             
             # Create the event
             event_result = self.service.events().insert(calendarId=cal_id, body=event).execute()
+            self._invalidate_list_cache(cal_id)
             
             return {
                 "action": "create_event",
@@ -407,15 +756,16 @@ class GoogleCalendarManager:
                 end_date = date
             
             # Parse date range - start from beginning of day
+            now = datetime.now()
             if start_date:
-                start_dt = self._parse_date(start_date)
+                start_dt = self._parse_date(start_date, now)
                 # Start from beginning of the day
                 start_dt = start_dt.replace(hour=0, minute=0, second=0, microsecond=0)
             else:
-                start_dt = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+                start_dt = now.replace(hour=0, minute=0, second=0, microsecond=0)
             
             if end_date:
-                end_dt = self._parse_date(end_date)
+                end_dt = self._parse_date(end_date, now)
                 # End at the end of the day
                 end_dt = end_dt.replace(hour=23, minute=59, second=59, microsecond=999999)
             else:
@@ -431,31 +781,19 @@ class GoogleCalendarManager:
             if end_dt <= start_dt:
                 end_dt = start_dt.replace(hour=23, minute=59, second=59, microsecond=999999)
             
-            # Convert to UTC for Google Calendar API
-            # Apply local timezone first, then convert to UTC
-            import time
-            try:
-                import platform
-                if platform.system() == 'Windows':
-                    local_tz = pytz.timezone('UTC')  # Fallback to UTC for Windows
-                else:
-                    local_tz_name = time.tzname[0] if not time.daylight else time.tzname[1]
-                    local_tz = pytz.timezone(local_tz_name)
-            except:
-                local_tz = pytz.timezone('UTC')
-            
-            # Localize to timezone then convert to UTC
-            start_dt_tz = local_tz.localize(start_dt)
-            end_dt_tz = local_tz.localize(end_dt)
+            # The API accepts any UTC offset, so send local times as-is
+            time_min = _LOCAL_TZ.localize(start_dt).isoformat()
+            time_max = _LOCAL_TZ.localize(end_dt).isoformat()
+            date_range = f"{time_min[:10]} to {time_max[:10]}"
             
-            start_dt_utc = start_dt_tz.astimezone(pytz.UTC)
-            end_dt_utc = end_dt_tz.astimezone(pytz.UTC)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Calendar search range: %s to %s", time_min, time_max)
             
-            # Convert to ISO format for API
-            time_min = start_dt_utc.isoformat()
-            time_max = end_dt_utc.isoformat()
-            
-            print(f"[DEBUG] Calendar search range: {time_min} to {time_max}")
+            # Serve repeat queries from the short-lived cache
+            cache_key = (cal_id, time_min, time_max, max_results)
+            cached = self._list_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < _LIST_TTL:
+                return {**copy.deepcopy(cached[1]), "cached": True}
             
             # Call the Calendar API
             events_result = self.service.events().list(
@@ -464,12 +802,14 @@ class GoogleCalendarManager:
                 timeMax=time_max,
                 maxResults=max_results,
                 singleEvents=True,
-                orderBy='startTime'
+                orderBy='startTime',
+                fields=_LIST_FIELDS
             ).execute()
             
             events = events_result.get('items', [])
             
-            print(f"[DEBUG] Found {len(events)} events in Google Calendar")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Found %d events in Google Calendar", len(events))
             
             # Format events for display
             formatted_events = []
@@ -477,15 +817,13 @@ class GoogleCalendarManager:
                 start = event['start'].get('dateTime', event['start'].get('date'))
                 end = event['end'].get('dateTime', event['end'].get('date'))
                 
-                # Parse datetime
-                if 'T' in start:  # DateTime format
-                    start_dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
-                    end_dt = datetime.fromisoformat(end.replace('Z', '+00:00'))
-                    start_str = start_dt.strftime("%Y-%m-%d %H:%M")
-                    end_str = end_dt.strftime("%H:%M")
-                else:  # Date only format
+                # Slice the wall-clock fields straight out of the ISO strings
+                if len(start) == 10:  # Date only format
                     start_str = start
                     end_str = "All day"
+                else:  # DateTime format: YYYY-MM-DDTHH:MM...
+                    start_str = f"{start[:10]} {start[11:16]}"
+                    end_str = end[11:16]
                 
                 formatted_events.append({
                     "id": event.get('id'),
@@ -498,17 +836,81 @@ class GoogleCalendarManager:
                     "link": event.get('htmlLink', '')
                 })
             
-            return {
+            result = {
                 "action": "list_events",
                 "events": formatted_events,
                 "count": len(formatted_events),
-                "date_range": f"{start_dt.strftime('%Y-%m-%d')} to {end_dt.strftime('%Y-%m-%d')}"
+                "date_range": date_range
             }
+            self._list_cache[cache_key] = (time.monotonic(), copy.deepcopy(result))
+            return result
             
         except Exception as e:
-            print(f"[DEBUG] Calendar list error: {str(e)}")
+            logger.debug("Calendar list error: %s", e)
             return {"error": f"Failed to list events: {str(e)}"}
     
+    def _build_patch_body(self, cal_id: str, event_id: str, title: str = None,
+                          description: str = None, location: str = None, date: str = None,
+                          time: str = None, end_time: str = None, timezone: str = None,
+                          attendees: str = None, **kwargs) -> Dict[str, Any]:
+        """Build a partial events().patch body from the provided fields"""
+        body = {}
+        
+        if title:
+            body['summary'] = title
+        
+        if description is not None:
+            body['description'] = description
+        
+        if location is not None:
+            body['location'] = location
+        
+        # Handle time updates
+        if date or time:
+            date_str = date or ''
+            time_str = time or ''
+            
+            # The current event is only needed to fill in a missing date/time
+            # or to preserve the duration when no end time is given
+            current = None
+            if not (date_str and time_str and end_time):
+                current = self.service.events().get(calendarId=cal_id, eventId=event_id,
+                                                    fields='start,end').execute()
+                current_start = current['start'].get('dateTime', current['start'].get('date'))
+                current_dt = _parse_iso(current_start)
+                
+                if not date_str:
+                    date_str = current_dt.strftime('%Y-%m-%d')
+                if not time_str:
+                    time_str = current_dt.strftime('%H:%M')
+            
+            now = datetime.now()
+            new_start_dt, tz_name = self._create_datetime(date_str, time_str, timezone, now)
+            
+            if end_time:
+                new_end_dt, _ = self._create_datetime(date_str, end_time, timezone, now)
+            else:
+                # Calculate duration to preserve it
+                current_end = current['end'].get('dateTime', current['end'].get('date'))
+                current_end_dt = _parse_iso(current_end)
+                new_end_dt = new_start_dt + (current_end_dt - current_dt)
+            
+            body['start'] = {
+                'dateTime': new_start_dt.isoformat(),
+                'timeZone': tz_name,
+            }
+            body['end'] = {
+                'dateTime': new_end_dt.isoformat(),
+                'timeZone': tz_name,
+            }
+        
+        # Handle attendees update
+        if attendees is not None:
+            emails = [email.strip() for email in attendees.split(',')]
+            body['attendees'] = [{'email': email} for email in emails if email]
+        
+        return body
+    
     def _update_event(self, event_id: str = None, calendar_id: str = None, **kwargs) -> Dict[str, Any]:
         """Update an existing Google Calendar event"""
         
@@ -518,73 +920,19 @@ class GoogleCalendarManager:
         cal_id = calendar_id or self.calendar_id
         
         try:
-            # Get the existing event
-            event = self.service.events().get(calendarId=cal_id, eventId=event_id).execute()
-            
-            # Update fields based on provided parameters
-            if 'title' in kwargs and kwargs['title']:
-                event['summary'] = kwargs['title']
-            
-            if 'description' in kwargs and kwargs['description'] is not None:
-                event['description'] = kwargs['description']
+            body = self._build_patch_body(cal_id, event_id, **kwargs)
             
-            if 'location' in kwargs and kwargs['location'] is not None:
-                event['location'] = kwargs['location']
-            
-            # Handle time updates
-            if 'date' in kwargs or 'time' in kwargs:
-                date_str = kwargs.get('date', '')
-                time_str = kwargs.get('time', '')
-                timezone_str = kwargs.get('timezone', '')
-                
-                if date_str or time_str:
-                    # Get current start time as fallback
-                    current_start = event['start'].get('dateTime', event['start'].get('date'))
-                    current_dt = datetime.fromisoformat(current_start.replace('Z', '+00:00'))
-                    
-                    # Create new start time
-                    if not date_str:
-                        date_str = current_dt.strftime('%Y-%m-%d')
-                    if not time_str:
-                        time_str = current_dt.strftime('%H:%M')
-                    
-                    new_start_dt = self._create_datetime(date_str, time_str, timezone_str)
-                    
-                    # Calculate duration to preserve it
-                    current_end = event['end'].get('dateTime', event['end'].get('date'))
-                    current_end_dt = datetime.fromisoformat(current_end.replace('Z', '+00:00'))
-                    duration = current_end_dt - current_dt
-                    
-                    new_end_dt = new_start_dt + duration
-                    
-                    # Update start and end times
-                    event['start'] = {
-                        'dateTime': new_start_dt.isoformat(),
-                        'timeZone': str(new_start_dt.tzinfo),
-                    }
-                    event['end'] = {
-                        'dateTime': new_end_dt.isoformat(),
-                        'timeZone': str(new_end_dt.tzinfo),
-                    }
-            
-            # Handle attendees update
-            if 'attendees' in kwargs and kwargs['attendees'] is not None:
-                if kwargs['attendees']:
-                    emails = [email.strip() for email in kwargs['attendees'].split(',')]
-                    event['attendees'] = [{'email': email} for email in emails if email]
-                else:
-                    event['attendees'] = []
-            
-            # Update the event
-            updated_event = self.service.events().update(
-                calendarId=cal_id, eventId=event_id, body=event
+            # patch() only sends the changed fields - no read-modify-write round trip
+            updated_event = self.service.events().patch(
+                calendarId=cal_id, eventId=event_id, body=body
             ).execute()
+            self._invalidate_list_cache(cal_id)
             
             return {
                 "action": "update_event",
                 "event_id": event_id,
                 "event_link": updated_event.get('htmlLink'),
-                "message": f"Event '{event.get('summary')}' updated successfully"
+                "message": f"Event '{updated_event.get('summary')}' updated successfully"
             }
             
         except HttpError as e:
@@ -605,11 +953,13 @@ class GoogleCalendarManager:
         
         try:
             # Get event details before deletion
-            event = self.service.events().get(calendarId=cal_id, eventId=event_id).execute()
+            event = self.service.events().get(calendarId=cal_id, eventId=event_id,
+                                              fields='summary').execute()
             event_title = event.get('summary', 'Unknown')
             
             # Delete the event
             self.service.events().delete(calendarId=cal_id, eventId=event_id).execute()
+            self._invalidate_list_cache(cal_id)
             
             return {
                 "action": "delete_event",
@@ -626,8 +976,53 @@ class GoogleCalendarManager:
         except Exception as e:
             return {"error": f"Failed to delete event: {str(e)}"}
     
-    def _get_event_details(self, event_id: str = None, calendar_id: str = None) -> Dict[str, Any]:
-        """Get detailed information about a specific event"""
+    @staticmethod
+    def _format_event_details(event: Dict[str, Any]) -> Dict[str, Any]:
+        """Format a raw API event resource for get_event_details output"""
+        start = event['start'].get('dateTime', event['start'].get('date'))
+        end = event['end'].get('dateTime', event['end'].get('date'))
+        
+        # Format attendees
+        attendees = event.get('attendees', [])
+        attendee_info = []
+        for attendee in attendees:
+            attendee_info.append({
+                'email': attendee.get('email'),
+                'status': attendee.get('responseStatus', 'needsAction'),
+                'optional': attendee.get('optional', False)
+            })
+        
+        return {
+            "id": event.get('id'),
+            "title": event.get('summary', 'No title'),
+            "description": event.get('description', ''),
+            "location": event.get('location', ''),
+            "start": start,
+            "end": end,
+            "attendees": attendee_info,
+            "creator": event.get('creator', {}).get('email', 'Unknown'),
+            "link": event.get('htmlLink', ''),
+            "status": event.get('status', 'confirmed')
+        }
+    
+    def _get_event_details(self, event_id: str = None, calendar_id: str = None,
+                           event_ids: str = None) -> Dict[str, Any]:
+        """Get detailed information about a specific event (or several via event_ids)"""
+        
+        if event_ids:
+            # Fetch every requested event in a single batch round-trip
+            ids = [eid.strip() for eid in event_ids.split(',') if eid.strip()]
+            ops = [{"action": "get_event_details", "client_id": eid, "event_id": eid,
+                    "calendar_id": calendar_id} for eid in ids]
+            batch_result = self.execute_batch(ops)
+            results = batch_result.get("results", {})
+            events = [results[eid]["event"] for eid in ids if "event" in results.get(eid, {})]
+            return {
+                "action": "get_event_details",
+                "events": events,
+                "count": len(events),
+                "message": f"Fetched details for {len(events)} of {len(ids)} events"
+            }
         
         if not event_id:
             return {"error": "Event ID is required"}
@@ -635,35 +1030,12 @@ class GoogleCalendarManager:
         cal_id = calendar_id or self.calendar_id
         
         try:
-            event = self.service.events().get(calendarId=cal_id, eventId=event_id).execute()
-            
-            start = event['start'].get('dateTime', event['start'].get('date'))
-            end = event['end'].get('dateTime', event['end'].get('date'))
-            
-            # Format attendees
-            attendees = event.get('attendees', [])
-            attendee_info = []
-            for attendee in attendees:
-                attendee_info.append({
-                    'email': attendee.get('email'),
-                    'status': attendee.get('responseStatus', 'needsAction'),
-                    'optional': attendee.get('optional', False)
-                })
+            event = self.service.events().get(calendarId=cal_id, eventId=event_id,
+                                              fields=_EVENT_FIELDS).execute()
             
             return {
                 "action": "get_event_details",
-                "event": {
-                    "id": event.get('id'),
-                    "title": event.get('summary', 'No title'),
-                    "description": event.get('description', ''),
-                    "location": event.get('location', ''),
-                    "start": start,
-                    "end": end,
-                    "attendees": attendee_info,
-                    "creator": event.get('creator', {}).get('email', 'Unknown'),
-                    "link": event.get('htmlLink', ''),
-                    "status": event.get('status', 'confirmed')
-                }
+                "event": self._format_event_details(event)
             }
             
         except HttpError as e:
@@ -677,12 +1049,19 @@ class GoogleCalendarManager:
     def _list_calendars(self) -> Dict[str, Any]:
         """List available calendars"""
         
+        cached = self._calendars_cache
+        if cached and time.monotonic() - cached[0] < _CALENDARS_TTL:
+            return {**copy.deepcopy(cached[1]), "cached": True}
+        
         try:
-            calendar_list = self.service.calendarList().list().execute()
+            calendar_list = self.service.calendarList().list(fields=_CALENDAR_FIELDS).execute()
             calendars = calendar_list.get('items', [])
             
             formatted_calendars = []
+            primary_name = None
             for cal in calendars:
+                if primary_name is None and cal.get('primary'):
+                    primary_name = cal.get('summary')
                 formatted_calendars.append({
                     "id": cal.get('id'),
                     "name": cal.get('summary'),
@@ -691,81 +1070,107 @@ class GoogleCalendarManager:
                     "access_role": cal.get('accessRole', 'reader')
                 })
             
-            return {
+            result = {
                 "action": "list_calendars",
                 "calendars": formatted_calendars,
-                "count": len(formatted_calendars)
+                "count": len(formatted_calendars),
+                "primary_name": primary_name or 'Unknown'
             }
+            self._calendars_cache = (time.monotonic(), copy.deepcopy(result))
+            return result
             
         except Exception as e:
             return {"error": f"Failed to list calendars: {str(e)}"}
     
     def _find_free_time(self, date: str = None, duration: int = 60, 
                        calendar_id: str = None, work_start: str = "09:00",
-                       work_end: str = "17:00") -> Dict[str, Any]:
-        """Find free time slots on a given date"""
+                       work_end: str = "17:00", calendar_ids: str = None) -> Dict[str, Any]:
+        """Find free time slots on a given date (busy in any of calendar_ids counts as busy)"""
         
-        cal_id = calendar_id or self.calendar_id
+        if calendar_ids:
+            cal_ids = [cid.strip() for cid in calendar_ids.split(',') if cid.strip()]
+        else:
+            cal_ids = [calendar_id or self.calendar_id]
         
         try:
             # Parse target date
             target_date = self._parse_date(date or "today")
             
-            # Get events for the day
-            start_of_day = target_date.replace(hour=0, minute=0, second=0, microsecond=0)
-            end_of_day = target_date.replace(hour=23, minute=59, second=59, microsecond=999999)
+            local_tz = _LOCAL_TZ
             
-            events_result = self.service.events().list(
-                calendarId=cal_id,
-                timeMin=start_of_day.isoformat() + 'Z',
-                timeMax=end_of_day.isoformat() + 'Z',
-                singleEvents=True,
-                orderBy='startTime'
-            ).execute()
+            # Get events for the (local) day
+            start_of_day = local_tz.localize(target_date.replace(hour=0, minute=0, second=0, microsecond=0))
+            end_of_day = local_tz.localize(target_date.replace(hour=23, minute=59, second=59, microsecond=999999))
             
-            events = events_result.get('items', [])
+            # Busy times per calendar are reused for a short while; writes
+            # through this manager drop them via _invalidate_list_cache
+            time_min, time_max = start_of_day.isoformat(), end_of_day.isoformat()
+            now = time.monotonic()
+            events = []
+            missing = []
+            for cal_id in cal_ids:
+                cached = self._list_cache.get((cal_id, time_min, time_max, 'busy'))
+                if cached and now - cached[0] < _LIST_TTL:
+                    events.extend(cached[1])
+                else:
+                    missing.append(cal_id)
+            
+            # One list request per uncached calendar, sent together in a single
+            # batch (no orderBy - intervals are sorted locally)
+            requests = [
+                self.service.events().list(
+                    calendarId=cal_id,
+                    timeMin=time_min,
+                    timeMax=time_max,
+                    singleEvents=True,
+                    fields=_BUSY_FIELDS
+                )
+                for cal_id in missing
+            ]
+            
+            for cal_id, (events_result, exception) in zip(missing, self._execute_requests(requests)):
+                if exception is not None:
+                    raise exception
+                items = events_result.get('items', [])
+                self._list_cache[(cal_id, time_min, time_max, 'busy')] = (now, items)
+                events.extend(items)
             
             # Parse work hours
             work_start_hour, work_start_min = self._parse_time(work_start)
             work_end_hour, work_end_min = self._parse_time(work_end)
             
-            work_start_dt = target_date.replace(hour=work_start_hour, minute=work_start_min)
-            work_end_dt = target_date.replace(hour=work_end_hour, minute=work_end_min)
+            work_start_dt = local_tz.localize(target_date.replace(hour=work_start_hour, minute=work_start_min,
+                                                                  second=0, microsecond=0))
+            work_end_dt = local_tz.localize(target_date.replace(hour=work_end_hour, minute=work_end_min,
+                                                                second=0, microsecond=0))
             
-            # Find free slots
-            free_slots = []
-            current_time = work_start_dt
+            # Busy intervals as epoch seconds, clipped to the working hours
+            work_lo = int(work_start_dt.timestamp())
+            work_hi = int(work_end_dt.timestamp())
+            bounds = [
+                (_parse_iso(event['start']['dateTime']).timestamp(),
+                 _parse_iso(event['end']['dateTime']).timestamp())
+                for event in events
+                if event['start'].get('dateTime') and event['end'].get('dateTime')
+            ]
+            busy = np.clip(np.array(bounds, dtype=np.int64).reshape(-1, 2), work_lo, work_hi)
+            busy = busy[np.argsort(busy[:, 0], kind='stable')]
             
-            for event in events:
-                event_start = event['start'].get('dateTime')
-                event_end = event['end'].get('dateTime')
-                
-                if event_start and event_end:
-                    event_start_dt = datetime.fromisoformat(event_start.replace('Z', '+00:00'))
-                    event_end_dt = datetime.fromisoformat(event_end.replace('Z', '+00:00'))
-                    
-                    # Convert to local date if needed
-                    if event_start_dt.date() == target_date.date():
-                        if current_time < event_start_dt:
-                            slot_duration = int((event_start_dt - current_time).total_seconds() / 60)
-                            if slot_duration >= duration:
-                                free_slots.append({
-                                    "start_time": current_time.strftime("%H:%M"),
-                                    "end_time": event_start_dt.strftime("%H:%M"),
-                                    "duration_available": slot_duration
-                                })
-                        
-                        current_time = max(current_time, event_end_dt)
-            
-            # Check for time after last event
-            if current_time < work_end_dt:
-                slot_duration = int((work_end_dt - current_time).total_seconds() / 60)
-                if slot_duration >= duration:
-                    free_slots.append({
-                        "start_time": current_time.strftime("%H:%M"),
-                        "end_time": work_end_dt.strftime("%H:%M"),
-                        "duration_available": slot_duration
-                    })
+            # Gap i runs from the latest end seen so far to the next start
+            gap_starts = np.concatenate(([work_lo], np.maximum.accumulate(busy[:, 1])))
+            gap_ends = np.concatenate((busy[:, 0], [work_hi]))
+            gap_minutes = (gap_ends - gap_starts) // 60
+            mask = (gap_ends > gap_starts) & (gap_minutes >= duration)
+            
+            free_slots = [
+                {
+                    "start_time": _clock(start, local_tz),
+                    "end_time": _clock(end, local_tz),
+                    "duration_available": minutes
+                }
+                for start, end, minutes in zip(gap_starts[mask].tolist(), gap_ends[mask].tolist(),
+                                               gap_minutes[mask].tolist())
+            ]
             
             return {
                 "action": "find_free_time",
@@ -777,4 +1182,71 @@ class GoogleCalendarManager:
             }
             
         except Exception as e:
-            return {"error": f"Failed to find free time: {str(e)}"} 
\ No newline at end of file
+            return {"error": f"Failed to find free time: {str(e)}"}
+    
+    # Action name -> handler, defined after the methods it references
+    _ACTIONS = {
+        "create_event": _create_event,
+        "list_events": _list_events,
+        "update_event": _update_event,
+        "delete_event": _delete_event,
+        "find_free_time": _find_free_time,
+        "get_event_details": _get_event_details,
+        "list_calendars": _list_calendars,
+        "batch": execute_batch,
+    }
+
+
+# Actions that change events; other workers drop their cached listings after them
+_WRITE_ACTIONS = frozenset({"create_event", "update_event", "delete_event", "batch"})
+
+
+class AsyncGoogleCalendarManager:
+    """asyncio front-end for GoogleCalendarManager that runs calls concurrently on worker threads"""
+    
+    def __init__(self, manager: Optional[GoogleCalendarManager] = None):
+        self._manager = manager or GoogleCalendarManager()
+        self._pool = ThreadPoolExecutor(max_workers=_POOL_WORKERS)
+        self._local = threading.local()
+        self._workers: List[GoogleCalendarManager] = []
+        self._workers_lock = threading.Lock()
+    
+    def _worker_manager(self) -> GoogleCalendarManager:
+        """Per-thread manager with its own service, Http and caches (shares credentials)"""
+        worker = getattr(self._local, 'manager', None)
+        if worker is None:
+            worker = copy.copy(self._manager)
+            worker.service = build('calendar', 'v3', http=self._manager._thread_http(), model=_API_MODEL,
+                                   cache_discovery=False, static_discovery=True)
+            # Nothing mutable is shared with other threads
+            worker._list_cache = {}
+            worker._calendars_cache = None
+            worker._pool = None
+            worker._local = threading.local()
+            self._local.manager = worker
+            with self._workers_lock:
+                self._workers.append(worker)
+        return worker
+    
+    def _execute_sync(self, action: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        worker = self._worker_manager()
+        result = worker.execute(action, **kwargs)
+        if action in _WRITE_ACTIONS:
+            # Swap in empty caches instead of mutating dicts other threads may be reading
+            with self._workers_lock:
+                others = [other for other in self._workers if other is not worker]
+            # The wrapped manager may still be called directly, so drop its listings too
+            if self._manager is not worker:
+                others.append(self._manager)
+            for other in others:
+                other._list_cache = {}
+        return result
+    
+    async def execute(self, action: str, **kwargs) -> Dict[str, Any]:
+        """Execute a calendar action without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, self._execute_sync, action, kwargs)
+    
+    async def execute_many(self, calls: List[tuple]) -> List[Dict[str, Any]]:
+        """Run several (action, kwargs) calls concurrently, preserving order"""
+        return await asyncio.gather(*(self.execute(action, **kwargs) for action, kwargs in calls))
@@ -1,50 +1,17 @@
+import copy
 import json
+import logging
 import re
+import time
 from typing import Dict, Any, List, Optional
 from .calculator import Calculator
 from .weather import WeatherChecker
 from .google_calendar import GoogleCalendarManager
 
-class ToolManager:
-    """Manages tool calling integration with LLM"""
-    
-    def __init__(self):
-        self.tools = {
-            "calculator": Calculator,
-            "weather_checker": WeatherChecker,
-        }
-        # Google Calendar manager needs instance for state management
-        try:
-            self.google_calendar = GoogleCalendarManager()
-            self.tools["google_calendar"] = self.google_calendar
-            print("✅ Google Calendar integration loaded successfully")
-        except Exception as e:
-            print(f"⚠️  Google Calendar not available: {str(e)}")
-            print("📋 To enable Google Calendar:")
-            print("   1. Install dependencies: pip install -r requirements_google_calendar.txt")
-            print("   2. Set up credentials: python setup_google_calendar.py")
-            print("   3. Restart the voice assistant")
-            print("🔧 Voice assistant will continue without Google Calendar functionality.")
-            # Don't add to tools if initialization failed
-    
-    def get_available_tools(self) -> List[Dict[str, Any]]:
-        """Get list of available tools for LLM system prompt"""
-        tool_descriptions = []
-        
-        for tool_name, tool_class in self.tools.items():
-            if tool_name == "google_calendar":
-                tool_info = tool_class.get_tool_info()
-            else:
-                tool_info = tool_class.get_tool_info()
-            tool_descriptions.append(tool_info)
-        
-        return tool_descriptions
-    
-    def get_tools_prompt(self) -> str:
-        """Generate tools section for LLM system prompt"""
-        tools = self.get_available_tools()
-        
-        prompt = """
+logger = logging.getLogger(__name__)
+
+# Fixed text around the per-tool sections of the tools prompt
+_TOOLS_PROMPT_HEADER = """
 
 AVAILABLE TOOLS:
 You have access to the following tools. When a user's request requires using a tool, respond with a tool call in this exact format:
@@ -68,27 +35,8 @@ CRITICAL FORMATTING RULES:
 Available tools:
 
 """
-        
-        for tool in tools:
-            prompt += f"**{tool['name']}**: {tool['description']}\n"
-            prompt += "Parameters:\n"
-            
-            properties = tool['parameters']['properties']
-            required = tool['parameters'].get('required', [])
-            
-            for param_name, param_info in properties.items():
-                required_mark = " (required)" if param_name in required else ""
-                param_type = param_info.get('type', 'string')
-                param_desc = param_info.get('description', '')
-                
-                prompt += f"  - {param_name} ({param_type}){required_mark}: {param_desc}\n"
-                
-                if 'enum' in param_info:
-                    prompt += f"    Options: {', '.join(param_info['enum'])}\n"
-            
-            prompt += "\n"
-        
-        prompt += """
+
+_TOOLS_PROMPT_FOOTER = """
 IMPORTANT TOOL CALLING RULES:
 1. ONLY use a tool when the user's request specifically requires tool functionality
 2. For simple questions that don't need tools, respond normally without tool calls
@@ -260,79 +208,324 @@ GENERAL TOOL GUIDELINES:
 - Always use "evaluate" mode for calculator unless specifically solving equations
 - Provide conversational responses along with tool calls when appropriate
 """
+
+# Tools whose results depend only on their parameters, with the seconds a
+# successful result stays reusable (None = until evicted). Calendar actions
+# read and write live state, and weather_checker keeps its own TTL cache.
+_RESULT_TTL = {
+    "calculator": None,
+}
+_RESULT_CACHE_SIZE = 256
+
+# Optional: orjson parses tool-call JSON and dumps fallback results faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_TOOL_CALL_OPEN = "<tool_call>"
+_TOOL_CALL_CLOSE = "</tool_call>"
+_JSON_DECODER = json.JSONDecoder()
+
+# Regex fallback for tool calls the scanner in _extract_tool_json cannot delimit.
+# One pass: an incomplete call (missing closing tag) wins, otherwise the first
+# brace-delimited JSON after <tool_call> - the same result as trying each in turn
+_TOOL_CALL_FALLBACK_RE = re.compile(
+    r'<tool_call>\s*(?:(\{.*?\})\s*(?:\n|$)|(\{[^<]*?\}))',
+    re.DOTALL,
+)
+# Bare JSON that looks like a tool call (cannot match without the marker)
+_BARE_JSON_MARKER = '"tool_name"'
+_BARE_JSON_RE = re.compile(r'^\s*(\{"tool_name":\s*"[^"]+",\s*"parameters":\s*\{[^}]*\}\})\s*$', re.MULTILINE)
+
+# Strips tool calls out of the speech-ready response text in one pass:
+# complete calls, then incomplete calls (missing closing tag), then stray tags
+_CLEAN_TOOL_CALL_RE = re.compile(
+    r'<tool_call>.*?</tool_call>'
+    r'|<tool_call>\s*\{[^<]*?\}\s*(?:\n|$)'
+    r'|</?tool_call[^>]*>',
+    re.DOTALL,
+)
+_CLEAN_WS_RE = re.compile(r'\n\s*\n')
+
+
+def _extract_tool_json(response: str) -> Optional[str]:
+    """Locate the first <tool_call> payload with plain string scanning; None if not delimitable"""
+    start = response.find(_TOOL_CALL_OPEN)
+    if start == -1:
+        return None
+    start += len(_TOOL_CALL_OPEN)
+    
+    # Complete tool call
+    end = response.find(_TOOL_CALL_CLOSE, start)
+    if end != -1:
+        return response[start:end].strip()
+    
+    # Missing closing tag - take the first complete JSON object after the tag
+    brace = start
+    while brace < len(response) and response[brace].isspace():
+        brace += 1
+    if not response.startswith('{', brace):
+        return None
+    try:
+        _, end = _JSON_DECODER.raw_decode(response, brace)
+    except ValueError:
+        return None
+    return response[brace:end]
+
+
+def _loads(text: str) -> Any:
+    """Decode JSON with orjson when available (its errors subclass json.JSONDecodeError)"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _dumps(value: Any, pretty: bool = False) -> str:
+    """Serialize a result dict (compact unless pretty), using stdlib json for types orjson rejects"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_INDENT_2 if pretty else 0).decode()
+        except TypeError:
+            pass
+    if pretty:
+        return json.dumps(value, indent=2, ensure_ascii=False)
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def _result_cache_key(tool_name: str, parameters: Dict[str, Any]) -> Optional[tuple]:
+    """Key a tool call by name and canonical parameters; None if the parameters cannot be keyed"""
+    try:
+        return (tool_name, json.dumps(parameters, sort_keys=True))
+    except (TypeError, ValueError):
+        return None
+
+
+def _format_calculator(result: Dict[str, Any]) -> str:
+    """Format a calculator result"""
+    if "calculation" in result:
+        return f"🧮 **{result['calculation']}**"
+    if "formatted_result" in result:
+        return f"🧮 **Result: {result['formatted_result']}**"
+    if "result" in result:
+        return f"🧮 **Result: {result['result']}**"
+    return f"🧮 **Calculation completed**"
+
+
+def _format_weather(result: Dict[str, Any]) -> Optional[str]:
+    """Format a weather result (None falls back to the raw dump)"""
+    if "summary" in result:
+        return f"{result['summary']}"
+    return None
+
+
+def _format_list_events(result: Dict[str, Any]) -> str:
+    """Summarize up to three listed events"""
+    events = result.get("events", [])
+    count = result.get("count", 0)
+    date_range = result.get("date_range", "")
+    
+    if count == 0:
+        return f"📅 No events found for {date_range}"
+    if count == 1:
+        event = events[0]
+        return f"📅 You have 1 event: '{event['title']}' at {event['start']} in {event['location'] or 'No location'}"
+    
+    event_list = []
+    for event in events[:3]:  # Show up to 3 events
+        location_text = f" in {event['location']}" if event['location'] else ""
+        event_list.append(f"'{event['title']}' at {event['start']}{location_text}")
+    
+    if count > 3:
+        return f"📅 You have {count} events. First 3: {', '.join(event_list)}, and {count - 3} more."
+    return f"📅 You have {count} events: {', '.join(event_list)}"
+
+
+def _format_free_time(result: Dict[str, Any]) -> str:
+    """Summarize up to three free slots"""
+    free_slots = result.get("free_slots", [])
+    date = result.get("date", "")
+    duration = result.get("requested_duration", 0)
+    
+    if not free_slots:
+        return f"📅 No free time slots found for {duration} minutes on {date}"
+    if len(free_slots) == 1:
+        slot = free_slots[0]
+        return f"📅 Found 1 free slot on {date}: {slot['start_time']} - {slot['end_time']} ({slot['duration_available']} min available)"
+    slot_list = [f"{slot['start_time']}-{slot['end_time']}" for slot in free_slots[:3]]
+    return f"📅 Found {len(free_slots)} free slots on {date}: {', '.join(slot_list)}"
+
+
+def _format_event_details(result: Dict[str, Any]) -> Optional[str]:
+    """Format a single event (None when the result has no event)"""
+    event = result.get("event", {})
+    if not event:
+        return None
+    location_text = f" in {event.get('location', 'No location')}" if event.get('location') else ""
+    return f"📅 Event: '{event.get('title')}' on {event.get('start')}{location_text}"
+
+
+def _format_list_calendars(result: Dict[str, Any]) -> str:
+    """Summarize the calendar list by count and primary calendar"""
+    count = result.get("count", 0)
+    return f"📅 You have {count} calendars. Primary: {result.get('primary_name', 'Unknown')}"
+
+
+# Calendar actions with a dedicated summary; the rest (create/update/delete, ...) use their message
+_CALENDAR_FORMATTERS = {
+    "list_events": _format_list_events,
+    "find_free_time": _format_free_time,
+    "get_event_details": _format_event_details,
+    "list_calendars": _format_list_calendars,
+}
+
+
+def _format_calendar(result: Dict[str, Any]) -> Optional[str]:
+    """Format a Google Calendar result (None falls back to the raw dump)"""
+    formatter = _CALENDAR_FORMATTERS.get(result.get("action", ""))
+    if formatter is not None:
+        formatted = formatter(result)
+        if formatted is not None:
+            return formatted
+    if "message" in result:
+        return f"📅 {result['message']}"
+    return None
+
+
+# Per-tool user-facing formatters, looked up by tool name
+_FORMATTERS = {
+    "calculator": _format_calculator,
+    "weather_checker": _format_weather,
+    "google_calendar": _format_calendar,
+}
+
+
+class ToolManager:
+    """Manages tool calling integration with LLM"""
+    
+    def __init__(self):
+        self._tools_prompt_cache: Optional[str] = None
+        self._result_cache: Dict[tuple, tuple] = {}
+        self.tools = {
+            "calculator": Calculator,
+            "weather_checker": WeatherChecker,
+        }
+        # Google Calendar manager needs instance for state management
+        try:
+            self.google_calendar = GoogleCalendarManager()
+            self.tools["google_calendar"] = self.google_calendar
+            print("✅ Google Calendar integration loaded successfully")
+        except Exception as e:
+            print(f"⚠️  Google Calendar not available: {str(e)}")
+            print("📋 To enable Google Calendar:")
+            print("   1. Install dependencies: pip install -r requirements_google_calendar.txt")
+            print("   2. Set up credentials: python setup_google_calendar.py")
+            print("   3. Restart the voice assistant")
+            print("🔧 Voice assistant will continue without Google Calendar functionality.")
+            # Don't add to tools if initialization failed
+        
+        # Tool schemas are static once the tool set is known
+        self._tool_descriptions = [tool.get_tool_info() for tool in self.tools.values()]
+    
+    def get_available_tools(self) -> List[Dict[str, Any]]:
+        """Get list of available tools for LLM system prompt"""
+        return list(self._tool_descriptions)
+    
+    def get_tools_prompt(self) -> str:
+        """Generate tools section for LLM system prompt (built once; the tool set is fixed after __init__)"""
+        if self._tools_prompt_cache is not None:
+            return self._tools_prompt_cache
+        
+        tools = self.get_available_tools()
+        
+        parts = [_TOOLS_PROMPT_HEADER]
+        
+        for tool in tools:
+            parts.append(f"**{tool['name']}**: {tool['description']}\n")
+            parts.append("Parameters:\n")
+            
+            properties = tool['parameters']['properties']
+            required = tool['parameters'].get('required', [])
+            
+            for param_name, param_info in properties.items():
+                required_mark = " (required)" if param_name in required else ""
+                param_type = param_info.get('type', 'string')
+                param_desc = param_info.get('description', '')
+                
+                parts.append(f"  - {param_name} ({param_type}){required_mark}: {param_desc}\n")
+                
+                if 'enum' in param_info:
+                    parts.append(f"    Options: {', '.join(param_info['enum'])}\n")
+            
+            parts.append("\n")
         
-        return prompt
+        parts.append(_TOOLS_PROMPT_FOOTER)
+        
+        self._tools_prompt_cache = "".join(parts)
+        return self._tools_prompt_cache
     
     def parse_tool_call(self, response: str) -> Optional[Dict[str, Any]]:
         """Parse tool call from LLM response - handles only the first tool call if multiple exist"""
-        # Look for tool call pattern - handle various formats
-        patterns = [
-            # Complete tool call
-            r'<tool_call>\s*(.*?)\s*</tool_call>',
-            # Incomplete tool call (missing closing tag)
-            r'<tool_call>\s*(\{.*?\})\s*(?:\n|$)',
-            # Even more flexible - just look for JSON after <tool_call>
-            r'<tool_call>\s*(\{[^<]*?\})',
-        ]
+        # Conversational replies carry neither a tag nor a bare tool-call object
+        if _TOOL_CALL_OPEN not in response and _BARE_JSON_MARKER not in response:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("No tool call pattern found in response: %r", response[:200])
+            return None
         
-        tool_call_json = None
-        for pattern in patterns:
-            match = re.search(pattern, response, re.DOTALL)
+        # Look for tool call pattern - plain scanning first, regexes for malformed output
+        tool_call_json = _extract_tool_json(response)
+        if tool_call_json:
+            logger.debug("Found tool call JSON: %s", tool_call_json)
+        elif _TOOL_CALL_OPEN in response:
+            match = _TOOL_CALL_FALLBACK_RE.search(response)
             if match:
-                tool_call_json = match.group(1).strip()
-                print(f"[DEBUG] Found tool call JSON with pattern: {tool_call_json}")
-                break
+                tool_call_json = match.group(match.lastindex).strip()
+                logger.debug("Found tool call JSON with pattern: %s", tool_call_json)
         
         # If no wrapped tool call found, check for bare JSON tool call
         if not tool_call_json:
             # Look for bare JSON that looks like a tool call
-            bare_json_pattern = r'^\s*(\{"tool_name":\s*"[^"]+",\s*"parameters":\s*\{[^}]*\}\})\s*$'
-            match = re.search(bare_json_pattern, response.strip(), re.MULTILINE)
+            match = _BARE_JSON_RE.search(response.strip())
             if match:
                 tool_call_json = match.group(1).strip()
-                print(f"[DEBUG] Found bare JSON tool call: {tool_call_json}")
+                logger.debug("Found bare JSON tool call: %s", tool_call_json)
         
         if not tool_call_json:
-            print(f"[DEBUG] No tool call pattern found in response: {repr(response[:200])}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("No tool call pattern found in response: %r", response[:200])
             return None
         
-        # Handle case where multiple tool calls might be concatenated
-        # Split on common delimiters and take the first valid JSON
-        possible_jsons = [
-            tool_call_json,
-            tool_call_json.split(' 和 ')[0],  # Handle Chinese "and" 
-            tool_call_json.split(' and ')[0],  # Handle English "and"
-            tool_call_json.split('\n')[0],     # Handle newline separation
-        ]
-        
-        for json_candidate in possible_jsons:
-            json_candidate = json_candidate.strip()
-            if json_candidate.startswith('{') and json_candidate.endswith('}'):
+        json_text = tool_call_json.strip()
+        if json_text.startswith('{'):
+            try:
+                tool_call = _loads(json_text)
+            except json.JSONDecodeError:
+                # Several tool calls may be concatenated (" and ", " 和 ", newlines) -
+                # take the first complete object and ignore whatever follows it
                 try:
-                    tool_call = json.loads(json_candidate)
-                    
-                    # Check if this is a malformed calculator call (missing tool_name and parameters wrapper)
-                    if "expression" in tool_call and "tool_name" not in tool_call:
-                        print(f"[DEBUG] Detected malformed calculator call, fixing...")
-                        # Fix the structure
-                        fixed_tool_call = {
-                            "tool_name": "calculator",
-                            "parameters": tool_call
-                        }
-                        print(f"[DEBUG] Fixed tool call: {fixed_tool_call}")
-                        return fixed_tool_call
-                    
-                    # Validate tool call structure
-                    if "tool_name" not in tool_call or "parameters" not in tool_call:
-                        continue
-                    
-                    print(f"[DEBUG] Successfully parsed tool call: {tool_call}")
-                    return tool_call
+                    tool_call, _ = _JSON_DECODER.raw_decode(json_text)
                 except json.JSONDecodeError as e:
-                    print(f"[DEBUG] JSON decode error for candidate '{json_candidate[:50]}...': {e}")
-                    continue
+                    logger.debug("JSON decode error for candidate '%s...': %s", json_text[:50], e)
+                    tool_call = None
+            
+            if tool_call is not None:
+                # Check if this is a malformed calculator call (missing tool_name and parameters wrapper)
+                if "expression" in tool_call and "tool_name" not in tool_call:
+                    logger.debug("Detected malformed calculator call, fixing...")
+                    # Fix the structure
+                    fixed_tool_call = {
+                        "tool_name": "calculator",
+                        "parameters": tool_call
+                    }
+                    logger.debug("Fixed tool call: %s", fixed_tool_call)
+                    return fixed_tool_call
+                
+                # Validate tool call structure
+                if "tool_name" in tool_call and "parameters" in tool_call:
+                    logger.debug("Successfully parsed tool call: %s", tool_call)
+                    return tool_call
         
-        print(f"[DEBUG] All JSON parsing attempts failed")
+        logger.debug("All JSON parsing attempts failed")
         return {"error": "Could not parse any valid tool call JSON"}
     
     def execute_tool_call(self, tool_call: Dict[str, Any]) -> Dict[str, Any]:
@@ -343,25 +536,38 @@ GENERAL TOOL GUIDELINES:
         tool_name = tool_call.get("tool_name")
         parameters = tool_call.get("parameters", {})
         
-        print(f"[DEBUG] Executing tool: {tool_name} with parameters: {parameters}")
+        logger.debug("Executing tool: %s with parameters: %s", tool_name, parameters)
         
-        if tool_name not in self.tools:
+        tool = self.tools.get(tool_name)
+        if tool is None:
             return {"error": f"Unknown tool: {tool_name}"}
         
+        # Serve repeat calls to deterministic tools from the result cache
+        cache_key = _result_cache_key(tool_name, parameters) if tool_name in _RESULT_TTL else None
+        if cache_key is not None:
+            cached = self._result_cache.get(cache_key)
+            ttl = _RESULT_TTL[tool_name]
+            if cached and (ttl is None or time.monotonic() - cached[0] < ttl):
+                logger.debug("Tool result served from cache: %s", cached[1])
+                return {
+                    "tool_name": tool_name,
+                    "parameters": parameters,
+                    "result": copy.deepcopy(cached[1]),
+                    "success": True
+                }
+        
         try:
-            tool = self.tools[tool_name]
+            # Static method for most tools, bound method for the calendar instance
+            result = tool.execute(**parameters)
             
-            # Execute tool with parameters
-            if tool_name == "google_calendar":
-                # Instance method for calendar - filter out any invalid parameters
-                action = parameters.get("action", "")
-                print(f"[DEBUG] Google Calendar action: {action}")
-                result = tool.execute(**parameters)
-            else:
-                # Static method for other tools
-                result = tool.execute(**parameters)
+            logger.debug("Tool execution result: %s", result)
             
-            print(f"[DEBUG] Tool execution result: {result}")
+            if cache_key is not None and "error" not in result:
+                # Oldest entries go first once the cache is full
+                self._result_cache.pop(cache_key, None)
+                if len(self._result_cache) >= _RESULT_CACHE_SIZE:
+                    self._result_cache.pop(next(iter(self._result_cache)))
+                self._result_cache[cache_key] = (time.monotonic(), copy.deepcopy(result))
             
             return {
                 "tool_name": tool_name,
@@ -371,8 +577,7 @@ GENERAL TOOL GUIDELINES:
             }
             
         except Exception as e:
-            print(f"[DEBUG] Tool execution failed with exception: {e}")
-            print(f"[DEBUG] Exception type: {type(e).__name__}")
+            logger.debug("Tool execution failed with %s: %s", type(e).__name__, e)
             return {
                 "tool_name": tool_name,
                 "parameters": parameters,
@@ -382,7 +587,7 @@ GENERAL TOOL GUIDELINES:
     
     def process_response_with_tools(self, llm_response: str) -> Dict[str, Any]:
         """Process LLM response, execute any tool calls, and return formatted result"""
-        print(f"[DEBUG] Processing LLM response for tool calls")
+        logger.debug("Processing LLM response for tool calls")
         
         # Check if response contains tool call
         tool_call = self.parse_tool_call(llm_response)
@@ -400,21 +605,23 @@ GENERAL TOOL GUIDELINES:
         
         # Remove ALL tool call patterns from response text to make it speech-ready
         cleaned_response = llm_response
-        
-        # Remove complete tool calls
-        cleaned_response = re.sub(r'<tool_call>.*?</tool_call>', '', cleaned_response, flags=re.DOTALL)
-        
-        # Remove incomplete tool calls
-        cleaned_response = re.sub(r'<tool_call>\s*\{[^<]*?\}\s*(?:\n|$)', '', cleaned_response, flags=re.DOTALL)
-        
-        # Remove any remaining <tool_call> tags
-        cleaned_response = re.sub(r'</?tool_call[^>]*>', '', cleaned_response)
+        tag_count = cleaned_response.count("tool_call")
+        if tag_count == 2:
+            # Exactly one complete call and nothing else to strip - slice it out
+            start = cleaned_response.find(_TOOL_CALL_OPEN)
+            end = cleaned_response.find(_TOOL_CALL_CLOSE, start) if start != -1 else -1
+            if end != -1:
+                cleaned_response = cleaned_response[:start] + cleaned_response[end + len(_TOOL_CALL_CLOSE):]
+            else:
+                cleaned_response = _CLEAN_TOOL_CALL_RE.sub('', cleaned_response)
+        elif tag_count:
+            cleaned_response = _CLEAN_TOOL_CALL_RE.sub('', cleaned_response)
         
         # Clean up extra whitespace and newlines
-        cleaned_response = re.sub(r'\n\s*\n', '\n', cleaned_response)
+        cleaned_response = _CLEAN_WS_RE.sub('\n', cleaned_response)
         cleaned_response = cleaned_response.strip()
         
-        print(f"[DEBUG] Cleaned response: '{cleaned_response}'")
+        logger.debug("Cleaned response: '%s'", cleaned_response)
         
         return {
             "type": "tool_response",
@@ -424,8 +631,8 @@ GENERAL TOOL GUIDELINES:
             "tool_result": tool_result
         }
     
-    def format_tool_result_for_user(self, tool_result: Dict[str, Any]) -> str:
-        """Format tool execution result for user display"""
+    def format_tool_result_for_user(self, tool_result: Dict[str, Any], pretty: bool = False) -> str:
+        """Format tool execution result for user display (pretty indents the raw-result fallback)"""
         # Check if there's an error in the tool result
         if "error" in tool_result.get("result", {}):
             return f"❌ {tool_result['result']['error']}"
@@ -438,77 +645,11 @@ GENERAL TOOL GUIDELINES:
         tool_name = tool_result.get("tool_name", "unknown")
         result = tool_result.get("result", {})
         
-        if tool_name == "calculator":
-            if "calculation" in result:
-                return f"🧮 **{result['calculation']}**"
-            elif "formatted_result" in result:
-                return f"🧮 **Result: {result['formatted_result']}**"
-            elif "result" in result:
-                return f"🧮 **Result: {result['result']}**"
-            else:
-                return f"🧮 **Calculation completed**"
-        
-        elif tool_name == "weather_checker":
-            if "summary" in result:
-                return f"{result['summary']}"
-        
-        elif tool_name == "google_calendar":
-            result = tool_result.get("result", {})
-            action = result.get("action", "")
-            
-            if action == "create_event":
-                if "message" in result:
-                    return f"📅 {result['message']}"
-            elif action == "list_events":
-                events = result.get("events", [])
-                count = result.get("count", 0)
-                date_range = result.get("date_range", "")
-                
-                if count == 0:
-                    return f"📅 No events found for {date_range}"
-                elif count == 1:
-                    event = events[0]
-                    return f"📅 You have 1 event: '{event['title']}' at {event['start']} in {event['location'] or 'No location'}"
-                else:
-                    event_list = []
-                    for event in events[:3]:  # Show up to 3 events
-                        location_text = f" in {event['location']}" if event['location'] else ""
-                        event_list.append(f"'{event['title']}' at {event['start']}{location_text}")
-                    
-                    if count > 3:
-                        return f"📅 You have {count} events. First 3: {', '.join(event_list)}, and {count - 3} more."
-                    else:
-                        return f"📅 You have {count} events: {', '.join(event_list)}"
-            elif action == "find_free_time":
-                free_slots = result.get("free_slots", [])
-                date = result.get("date", "")
-                duration = result.get("requested_duration", 0)
-                
-                if not free_slots:
-                    return f"📅 No free time slots found for {duration} minutes on {date}"
-                elif len(free_slots) == 1:
-                    slot = free_slots[0]
-                    return f"📅 Found 1 free slot on {date}: {slot['start_time']} - {slot['end_time']} ({slot['duration_available']} min available)"
-                else:
-                    slot_list = [f"{slot['start_time']}-{slot['end_time']}" for slot in free_slots[:3]]
-                    return f"📅 Found {len(free_slots)} free slots on {date}: {', '.join(slot_list)}"
-            elif action in ["update_event", "delete_event"]:
-                if "message" in result:
-                    return f"📅 {result['message']}"
-            elif action == "get_event_details":
-                event = result.get("event", {})
-                if event:
-                    location_text = f" in {event.get('location', 'No location')}" if event.get('location') else ""
-                    return f"📅 Event: '{event.get('title')}' on {event.get('start')}{location_text}"
-            elif action == "list_calendars":
-                calendars = result.get("calendars", [])
-                count = result.get("count", 0)
-                primary_cal = next((cal['name'] for cal in calendars if cal.get('primary')), 'Unknown')
-                return f"📅 You have {count} calendars. Primary: {primary_cal}"
-            
-            # Fallback for other calendar actions
-            if "message" in result:
-                return f"📅 {result['message']}"
+        formatter = _FORMATTERS.get(tool_name)
+        if formatter is not None:
+            formatted = formatter(result)
+            if formatted is not None:
+                return formatted
         
         # Fallback: return raw result
-        return f"🔧 {tool_name}: {json.dumps(result, indent=2)}" 
\ No newline at end of file
+        return f"🔧 {tool_name}: {_dumps(result, pretty)}" 
\ No newline at end of file
@@ -1,15 +1,83 @@
+import copy
 import json
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any
 from datetime import datetime
 import os
 
-# Load environment variables from .env file
+# Load environment variables from .env file (not needed once the key is set)
+if not os.environ.get('WEATHERSTACK_API_KEY'):
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()  # Load .env file if it exists
+    except ImportError:
+        pass  # python-dotenv not installed, skip loading
+
+# Optional: orjson decodes the API response faster than requests' stdlib json
 try:
-    from dotenv import load_dotenv
-    load_dotenv()  # Load .env file if it exists
+    import orjson
 except ImportError:
-    pass  # python-dotenv not installed, skip loading
+    orjson = None
+
+# Static tool schema, built once at import
+_TOOL_INFO = {
+    "name": "weather_checker",
+    "description": "Get current weather information for specified locations. Only use this when the user specifically asks about weather, temperature, or weather conditions.",
+    "parameters": {
+        "type": "object",
+        "properties": {
+            "location": {
+                "type": "string",
+                "description": "City name, region, or location (e.g., 'New York', 'London, UK', 'Tokyo, Japan', 'latitude,longitude')"
+            },
+            "units": {
+                "type": "string",
+                "description": "Temperature units: 'm' for metric (Celsius), 'f' for Fahrenheit, 's' for scientific",
+                "enum": ["m", "f", "s"],
+                "default": "m"
+            }
+        },
+        "required": ["location"]
+    }
+}
+
+# weatherstack error codes -> user-facing messages ({info} is the API's error info)
+_API_ERROR_MESSAGES = {
+    101: "Weather service authentication failed. Please check API key configuration.",
+    104: "Monthly API request limit reached. Please upgrade the weather service plan.",
+    601: "Invalid location '{info}'. Please provide a valid city name or coordinates.",
+    615: "Weather service request failed. Please try again later.",
+    404: "Weather data not found for the requested location.",
+    429: "Too many weather requests. Please wait a moment and try again.",
+    403: "Weather service feature not available on current plan."
+}
+
+# Shared session so repeat calls reuse the keep-alive connection to weatherstack
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=10))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=10))
+
+# weatherstack API key once found (env var or configs/config.yaml)
+_API_KEY = None
+
+# Recent successful results per (location, units), reused for _CACHE_TTL seconds
+_CACHE_TTL = 300.0
+_CACHE_SIZE = 256
+_CACHE: Dict[tuple, tuple] = {}
+_CACHE_LOCK = threading.Lock()
+
+# (connect, read) timeouts in seconds: an unreachable host fails fast
+_HTTP_TIMEOUT = (3.05, 10)
+
+# Temperature unit symbol per weatherstack units parameter
+_UNIT_SYMBOLS = {
+    "m": "°C",
+    "f": "°F",
+    "s": "K"
+}
 
 class WeatherChecker:
     """Weather checking tool using weatherstack API"""
@@ -20,30 +88,19 @@ class WeatherChecker:
     
     @staticmethod
     def get_tool_info() -> Dict[str, Any]:
-        """Get tool information for LLM"""
-        return {
-            "name": "weather_checker",
-            "description": "Get current weather information for specified locations. Only use this when the user specifically asks about weather, temperature, or weather conditions.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "location": {
-                        "type": "string",
-                        "description": "City name, region, or location (e.g., 'New York', 'London, UK', 'Tokyo, Japan', 'latitude,longitude')"
-                    },
-                    "units": {
-                        "type": "string",
-                        "description": "Temperature units: 'm' for metric (Celsius), 'f' for Fahrenheit, 's' for scientific",
-                        "enum": ["m", "f", "s"],
-                        "default": "m"
-                    }
-                },
-                "required": ["location"]
-            }
-        }
+        """Get tool information for LLM (shared schema dict - do not mutate)"""
+        return _TOOL_INFO
     
     @staticmethod
     def _get_api_key():
+        """Get weatherstack API key, resolved once and reused (a missing key is looked up again)"""
+        global _API_KEY
+        if not _API_KEY:
+            _API_KEY = WeatherChecker._resolve_api_key()
+        return _API_KEY
+    
+    @staticmethod
+    def _resolve_api_key():
         """Get weatherstack API key from environment variable or config"""
         # Try environment variable first
         api_key = os.getenv('WEATHERSTACK_API_KEY')
@@ -54,7 +111,8 @@ class WeatherChecker:
         try:
             import yaml
             with open('configs/config.yaml', 'r') as f:
-                config = yaml.safe_load(f)
+                # libyaml's C loader when PyYAML was built with it
+                config = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
                 return config.get('weatherstack', {}).get('api_key')
         except:
             pass
@@ -65,21 +123,24 @@ class WeatherChecker:
     @staticmethod
     def _handle_api_error(error_code: int, error_type: str, error_info: str) -> str:
         """Handle weatherstack API errors with user-friendly messages"""
-        error_messages = {
-            101: "Weather service authentication failed. Please check API key configuration.",
-            104: "Monthly API request limit reached. Please upgrade the weather service plan.",
-            601: f"Invalid location '{error_info}'. Please provide a valid city name or coordinates.",
-            615: "Weather service request failed. Please try again later.",
-            404: "Weather data not found for the requested location.",
-            429: "Too many weather requests. Please wait a moment and try again.",
-            403: "Weather service feature not available on current plan."
-        }
-        
-        return error_messages.get(error_code, f"Weather service error: {error_info}")
+        message = _API_ERROR_MESSAGES.get(error_code)
+        if message is None:
+            return f"Weather service error: {error_info}"
+        # Only the invalid-location message embeds the API's error info
+        return message.format(info=error_info) if error_code == 601 else message
     
     @staticmethod
     def execute(location: str, units: str = "m") -> Dict[str, Any]:
         """Execute weather checking operation using weatherstack API"""
+        if not isinstance(location, str) or not location.strip():
+            return {"error": "A location is required to check the weather."}
+        
+        cache_key = (location.strip().lower(), units)
+        with _CACHE_LOCK:
+            cached = _CACHE.get(cache_key)
+        if cached and time.monotonic() - cached[0] < _CACHE_TTL:
+            return copy.deepcopy(cached[1])
+        
         try:
             # Get API key
             api_key = WeatherChecker._get_api_key()
@@ -97,8 +158,8 @@ class WeatherChecker:
             }
             
             # Make API request with timeout
-            response = requests.get(url, params=params, timeout=10)
-            data = response.json()
+            response = _SESSION.get(url, params=params, timeout=_HTTP_TIMEOUT)
+            data = orjson.loads(response.content) if orjson is not None else response.json()
             
             # Check for API errors
             if not data.get("success", True) and "error" in data:
@@ -119,22 +180,27 @@ class WeatherChecker:
             location_info = data["location"]
             
             # Determine temperature unit symbol
-            unit_symbol = {
-                "m": "°C",
-                "f": "°F", 
-                "s": "K"
-            }.get(units, "°C")
+            unit_symbol = _UNIT_SYMBOLS.get(units, "°C")
+            
+            # Bind the fields the summary reads once
+            location_name = f"{location_info.get('name', location)}, {location_info.get('country', '')}".strip(", ")
+            temperature = current.get("temperature")
+            feels_like = current.get("feelslike")
+            condition = current.get("weather_descriptions", ["Unknown"])[0]
+            humidity = current.get("humidity")
+            wind_speed = current.get("wind_speed")
+            wind_direction = current.get("wind_dir")
             
             # Format weather response
             weather_data = {
-                "location": f"{location_info.get('name', location)}, {location_info.get('country', '')}".strip(", "),
+                "location": location_name,
                 "region": location_info.get("region", ""),
-                "temperature": current.get("temperature"),
-                "feels_like": current.get("feelslike"),
-                "condition": current.get("weather_descriptions", ["Unknown"])[0],
-                "humidity": current.get("humidity"),
-                "wind_speed": current.get("wind_speed"),
-                "wind_direction": current.get("wind_dir"),
+                "temperature": temperature,
+                "feels_like": feels_like,
+                "condition": condition,
+                "humidity": humidity,
+                "wind_speed": wind_speed,
+                "wind_direction": wind_direction,
                 "pressure": current.get("pressure"),
                 "visibility": current.get("visibility"),
                 "uv_index": current.get("uv_index"),
@@ -144,32 +210,29 @@ class WeatherChecker:
             }
             
             # Create summary message
-            summary_parts = [
-                f"Weather in {weather_data['location']}:",
-                f"{weather_data['temperature']}{unit_symbol}",
-                f"{weather_data['condition']}"
-            ]
-            
-            if weather_data.get('feels_like') and weather_data['feels_like'] != weather_data['temperature']:
-                summary_parts.append(f"(feels like {weather_data['feels_like']}{unit_symbol})")
-            
-            if weather_data.get('humidity'):
-                summary_parts.append(f"Humidity: {weather_data['humidity']}%")
-            
-            if weather_data.get('wind_speed'):
-                wind_text = f"Wind: {weather_data['wind_speed']} km/h"
-                if weather_data.get('wind_direction'):
-                    wind_text += f" {weather_data['wind_direction']}"
-                summary_parts.append(wind_text)
-            
-            summary = ", ".join(summary_parts)
+            summary = f"Weather in {location_name}:, {temperature}{unit_symbol}, {condition}"
+            if feels_like and feels_like != temperature:
+                summary += f", (feels like {feels_like}{unit_symbol})"
+            if humidity:
+                summary += f", Humidity: {humidity}%"
+            if wind_speed:
+                summary += f", Wind: {wind_speed} km/h"
+                if wind_direction:
+                    summary += f" {wind_direction}"
             
-            return {
-                "location": weather_data['location'],
+            result = {
+                "location": location_name,
                 "data": weather_data,
                 "summary": summary,
                 "success": True
             }
+            with _CACHE_LOCK:
+                # Oldest entries go first once the cache is full
+                _CACHE.pop(cache_key, None)
+                if len(_CACHE) >= _CACHE_SIZE:
+                    _CACHE.pop(next(iter(_CACHE)))
+                _CACHE[cache_key] = (time.monotonic(), copy.deepcopy(result))
+            return result
             
         except requests.RequestException as e:
             return {"error": f"Weather service connection failed: {str(e)}"}
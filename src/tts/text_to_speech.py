@@ -5,18 +5,43 @@ Simple, direct implementation based on working reference code.
 """
 
 import pyttsx3
+import re
 import threading
 import time
 from typing import Optional, Dict, Any, List
 from rich.console import Console
 
 
+# Characters TTS should not read out: drop markdown markers, space out underscores
+_CHAR_TRANSLATION = str.maketrans({"*": "", "#": "", "_": " "})
+
+# Common abbreviations spoken in full
+_ABBREVIATIONS = {
+    "e.g.": "for example",
+    "i.e.": "that is",
+    "etc.": "and so on",
+    "vs.": "versus",
+    "Dr.": "Doctor",
+    "Mr.": "Mister",
+    "Mrs.": "Misses",
+    "Ms.": "Miss",
+}
+# Longest first so overlapping keys resolve the same way in a single pass
+_ABBREVIATION_RE = re.compile("|".join(
+    re.escape(abbrev) for abbrev in sorted(_ABBREVIATIONS, key=len, reverse=True)
+))
+
+
 class TextToSpeech:
     """
     Simple, direct Text-to-Speech engine using pyttsx3.
     Based on proven working implementation.
     """
     
+    # (lowercased id, id) for each installed voice; enumerating them is slow
+    # and the set does not change while the process runs
+    _voice_ids = None
+    
     def __init__(self, 
                  rate: int = 200,
                  volume: float = 0.9,
@@ -57,11 +82,14 @@ class TextToSpeech:
             
             # Set voice if specified
             if self.voice:
-                voices = self._engine.getProperty('voices')
-                for voice in voices:
-                    if self.voice.lower() in voice.id.lower():
-                        self._engine.setProperty('voice', voice.id)
-                        break
+                if TextToSpeech._voice_ids is None:
+                    TextToSpeech._voice_ids = [(voice.id.lower(), voice.id)
+                                               for voice in self._engine.getProperty('voices')]
+                wanted = self.voice.lower()
+                match = next((voice_id for lowered, voice_id in TextToSpeech._voice_ids
+                              if wanted in lowered), None)
+                if match is not None:
+                    self._engine.setProperty('voice', match)
             
             self._initialized = True
             self.console.print("[green]TTS engine initialized successfully[/green]")
@@ -131,25 +159,11 @@ class TextToSpeech:
         # Remove excessive whitespace
         cleaned = " ".join(text.split())
         
-        # Remove or replace problematic characters
-        cleaned = cleaned.replace("*", "")  # Remove asterisks
-        cleaned = cleaned.replace("#", "")  # Remove hashtags
-        cleaned = cleaned.replace("_", " ")  # Replace underscores with spaces
+        # Remove or replace problematic characters in one pass
+        cleaned = cleaned.translate(_CHAR_TRANSLATION)
         
         # Handle common abbreviations
-        replacements = {
-            "e.g.": "for example",
-            "i.e.": "that is",
-            "etc.": "and so on",
-            "vs.": "versus",
-            "Dr.": "Doctor",
-            "Mr.": "Mister",
-            "Mrs.": "Misses",
-            "Ms.": "Miss",
-        }
-        
-        for abbrev, full in replacements.items():
-            cleaned = cleaned.replace(abbrev, full)
+        cleaned = _ABBREVIATION_RE.sub(lambda match: _ABBREVIATIONS[match.group(0)], cleaned)
         
         return cleaned.strip()
     
@@ -1,42 +1,61 @@
 import torch
 import numpy as np
 
+# Optional: onnxruntime runs the Silero model without the TorchScript interpreter
+try:
+    import onnxruntime  # noqa: F401
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+
 class VoiceActivityDetector:
     """
     Voice Activity Detection module using Silero VAD
     """
-    def __init__(self, sample_rate=16000, threshold=0.5):
+    def __init__(self, sample_rate=16000, threshold=0.5, use_onnx=None):
         """
         Initialize the VAD module
         
         Args:
             sample_rate: Audio sample rate
             threshold: Voice detection threshold
+            use_onnx: Load the ONNX export of the model (default: when onnxruntime is installed)
         """
         self.sample_rate = sample_rate
         self.threshold = threshold
+        self.use_onnx = ONNX_AVAILABLE if use_onnx is None else use_onnx
         
         # Load Silero VAD model
         self.model, utils = torch.hub.load(
             repo_or_dir='snakers4/silero-vad',
             model='silero_vad',
             force_reload=False,
-            onnx=False,
+            onnx=self.use_onnx,
             verbose=False
         )
         self.get_speech_timestamps = utils[0]
+        
+        # Reused float32 staging buffer for chunks that arrive in another dtype
+        self._buffer = torch.empty(0, dtype=torch.float32)
     
     def detect_speech(self, audio_chunk):
         """
         Detect if speech is present in the audio chunk
         
         Args:
-            audio_chunk: Numpy array of audio samples
+            audio_chunk: Numpy array of audio samples (contiguous float32 avoids a copy)
             
         Returns:
             list: Timestamps of detected speech segments
         """
-        audio_tensor = torch.from_numpy(audio_chunk).float()
+        if audio_chunk.dtype == np.float32 and audio_chunk.flags["C_CONTIGUOUS"]:
+            # Zero-copy view of the caller's samples
+            audio_tensor = torch.from_numpy(audio_chunk)
+        else:
+            if self._buffer.numel() < len(audio_chunk):
+                self._buffer = torch.empty(len(audio_chunk), dtype=torch.float32)
+            audio_tensor = self._buffer[:len(audio_chunk)]
+            audio_tensor.copy_(torch.from_numpy(audio_chunk))
         speech_timestamps = self.get_speech_timestamps(
             audio_tensor, 
             self.model, 
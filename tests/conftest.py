@@ -0,0 +1,4 @@
+import sys
+
+# Test runs are one-off; skip writing .pyc files for src/ and tests/
+sys.dont_write_bytecode = True
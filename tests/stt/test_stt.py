@@ -1,9 +1,16 @@
 import unittest
+from collections import namedtuple
 import numpy as np
 from unittest.mock import patch, MagicMock
 
 from src.stt import SpeechToText
 
+# 1 second of silence at 16kHz, float32 as Whisper ingests it (read-only, shared)
+_SILENCE_1S = np.zeros(16000, dtype=np.float32)
+
+# Minimal stand-in for a faster-whisper segment: transcribe only reads .text
+Segment = namedtuple('Segment', ['text'])
+
 class TestSpeechToText(unittest.TestCase):
     """
     Test cases for SpeechToText class
@@ -23,20 +30,16 @@ class TestSpeechToText(unittest.TestCase):
         """Test transcription functionality"""
         # Setup mock
         mock_model = MagicMock()
-        mock_segments = [
-            MagicMock(text="Hello"),
-            MagicMock(text="world")
-        ]
+        mock_segments = [Segment("Hello"), Segment("world")]
         mock_model.transcribe.return_value = (mock_segments, None)
         mock_whisper.return_value = mock_model
         
         # Create SpeechToText instance and call transcribe
         stt = SpeechToText()
-        audio_data = np.zeros(16000)  # 1 second of silence at 16kHz
-        result = stt.transcribe(audio_data)
+        result = stt.transcribe(_SILENCE_1S)
         
         # Verify results
-        mock_model.transcribe.assert_called_once_with(audio_data, language="en")
+        mock_model.transcribe.assert_called_once_with(_SILENCE_1S, language="en")
         self.assertEqual(result, "Hello world")
 
 if __name__ == '__main__':
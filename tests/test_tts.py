@@ -4,20 +4,46 @@ Test module for Text-to-Speech functionality.
 
 import time
 import pytest
+from unittest.mock import MagicMock
+
 from src.tts import TextToSpeech
 
 
+@pytest.fixture(scope="module", autouse=True)
+def _engine():
+    """Stand-in pyttsx3 engine so speech calls return immediately."""
+    engine = MagicMock()
+    with pytest.MonkeyPatch.context() as patcher:
+        patcher.setattr('src.tts.text_to_speech.pyttsx3.init', lambda *args, **kwargs: engine)
+        yield engine
+
+
+@pytest.fixture
+def mock_engine(_engine):
+    """The stand-in engine with its call history cleared."""
+    _engine.reset_mock()
+    return _engine
+
+
+@pytest.fixture(scope="class")
+def class_tts():
+    """One TextToSpeech per test class; engine start-up is the slow part."""
+    tts = TextToSpeech(rate=250, volume=0.8)
+    yield tts
+    tts.shutdown()
+
+
 class TestTextToSpeech:
     """Test cases for TextToSpeech class."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.tts = TextToSpeech(rate=250, volume=0.8)
-    
-    def teardown_method(self):
-        """Clean up after tests."""
-        if hasattr(self, 'tts') and self.tts:
-            self.tts.shutdown()
+    @pytest.fixture(autouse=True)
+    def reset(self, class_tts, mock_engine):
+        """Restore the shared instance's settings before each test."""
+        class_tts.set_rate(250)
+        class_tts.set_volume(0.8)
+        class_tts.stop()
+        mock_engine.reset_mock()
+        self.tts = class_tts
     
     def test_initialization(self):
         """Test TTS engine initialization."""
@@ -46,15 +72,13 @@ class TestTextToSpeech:
         result = self.tts.speak_async("")
         assert result is False
     
-    def test_speak_blocking(self):
+    def test_speak_blocking(self, mock_engine):
         """Test blocking speech."""
-        start_time = time.time()
         result = self.tts.speak("Short test")
-        duration = time.time() - start_time
         
         assert result is True
-        # Should take some time for blocking speech
-        assert duration > 0.1
+        mock_engine.say.assert_called_once_with("Short test")
+        mock_engine.runAndWait.assert_called_once()
     
     def test_voice_management(self):
         """Test voice-related functionality."""
@@ -93,11 +117,10 @@ class TestTextToSpeech:
         self.tts.stop()
         
         # Should not be speaking after stop
-        time.sleep(0.2)  # Small delay
         assert self.tts.is_speaking() is False
 
 
-def test_tts_integration():
+def test_tts_integration(mock_engine):
     """Integration test for TTS with voice assistant workflow."""
     tts = TextToSpeech(rate=300, volume=0.7)
     
@@ -113,10 +136,8 @@ def test_tts_integration():
         for response in responses:
             result = tts.speak_async(response)
             assert result is True
-            time.sleep(0.1)  # Small delay between responses
         
-        # Wait a bit for speech to process
-        time.sleep(1.0)
+        assert mock_engine.say.call_count == len(responses)
         
     finally:
         tts.shutdown()
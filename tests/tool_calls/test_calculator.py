@@ -0,0 +1,61 @@
+import unittest
+
+from src.tool_calls.calculator import Calculator
+
+class TestCalculator(unittest.TestCase):
+    """
+    Test cases for Calculator class
+    """
+    def test_evaluate(self):
+        """Test numeric evaluation of explicit expressions"""
+        result = Calculator.execute("sqrt(144) + 2^3")
+        self.assertEqual(result["formatted_result"], "20")
+        
+        result = Calculator.execute("7! / (2! * 3!)")
+        self.assertEqual(result["formatted_result"], "420")
+    
+    def test_solve_implicit_multiplication(self):
+        """Test that 'x(x-2)' is read as x*(x-2), not a call to a function x"""
+        result = Calculator.execute("x(x-2)", mode="solve")
+        self.assertNotIn("error", result)
+        self.assertEqual(result["formatted_result"], "0, 2")
+    
+    def test_expand_implicit_multiplication(self):
+        """Test expanding an implicitly multiplied expression"""
+        result = Calculator.execute("x(x+1)", mode="expand")
+        self.assertEqual(result["formatted_result"], "x**2 + x")
+        
+        result = Calculator.execute("t(t-3)", mode="factor", variable="t")
+        self.assertEqual(result["formatted_result"], "t*(t - 3)")
+    
+    def test_implicit_multiplication_with_power(self):
+        """Test that '^' stays a power when the implicit-multiplication parser is used"""
+        result = Calculator.execute("x(x+1)^2", mode="expand")
+        self.assertEqual(result["formatted_result"], "x**3 + 2*x**2 + x")
+        
+        result = Calculator.execute("x(x-2)^2", mode="solve")
+        self.assertEqual(result["formatted_result"], "0, 2")
+    
+    def test_unparseable_expression(self):
+        """Test that invalid syntax returns a parse error"""
+        result = Calculator.execute("2x+")
+        self.assertIn("Could not parse expression", result["error"])
+    
+    def test_natural_language_rejected(self):
+        """Test that natural-language descriptions are rejected"""
+        result = Calculator.execute("area of circle")
+        self.assertIn("mathematical formulas", result["error"])
+        
+        result = Calculator.execute("area circle")
+        self.assertIn("mathematical formulas", result["error"])
+    
+    def test_dimension_words_as_variables(self):
+        """Test that dimension words are still accepted as variable names"""
+        result = Calculator.execute("area*2")
+        self.assertEqual(result["formatted_result"], "2*area")
+        
+        result = Calculator.execute("volume - 10", mode="solve", variable="volume")
+        self.assertEqual(result["formatted_result"], "10")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,316 @@
+import asyncio
+import unittest
+from unittest.mock import patch, MagicMock
+
+import httplib2
+import pytz
+from googleapiclient.errors import HttpError
+
+from src.tool_calls.google_calendar import GoogleCalendarManager, AsyncGoogleCalendarManager
+
+def _make_manager():
+    """GoogleCalendarManager with authentication skipped and a mocked service"""
+    with patch.object(GoogleCalendarManager, '_authenticate'):
+        manager = GoogleCalendarManager()
+    manager.service = MagicMock()
+    return manager
+
+def _timed_event(event_id, start, end, title="Meeting"):
+    return {
+        "id": event_id,
+        "summary": title,
+        "start": {"dateTime": start},
+        "end": {"dateTime": end},
+    }
+
+class _FakeRequest:
+    """API request stub that returns a response or raises an error"""
+    def __init__(self, response=None, error=None):
+        self.response = response
+        self.error = error
+        self.calls = 0
+    
+    def execute(self, http=None):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+class _FakeBatch:
+    """BatchHttpRequest stub that runs its requests in order, optionally failing after fail_after of them"""
+    def __init__(self, callback, fail_after=None):
+        self.callback = callback
+        self.fail_after = fail_after
+        self.requests = []
+    
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+    
+    def execute(self):
+        for index, (request_id, request) in enumerate(self.requests):
+            if index == self.fail_after:
+                raise httplib2.HttpLib2Error("batch connection reset")
+            try:
+                self.callback(request_id, request.execute(), None)
+            except HttpError as e:
+                self.callback(request_id, None, e)
+
+def _not_found():
+    return HttpError(httplib2.Response({'status': 404}), b'not found')
+
+class TestListEvents(unittest.TestCase):
+    """
+    Test cases for GoogleCalendarManager list_events
+    """
+    def setUp(self):
+        self.manager = _make_manager()
+        self.list_call = self.manager.service.events.return_value.list
+        self.list_call.return_value.execute.return_value = {
+            "items": [_timed_event("e1", "2030-01-02T10:00:00+00:00", "2030-01-02T11:00:00+00:00")]
+        }
+    
+    def test_list_events_filters_by_range(self):
+        """Test that list_events asks the API for the requested range in start order"""
+        result = self.manager.execute("list_events", date="2030-01-02")
+        
+        self.assertEqual(result["count"], 1)
+        self.assertEqual(result["events"][0]["start"], "2030-01-02 10:00")
+        self.assertEqual(result["events"][0]["end"], "11:00")
+        kwargs = self.list_call.call_args.kwargs
+        self.assertTrue(kwargs["timeMin"].startswith("2030-01-02T00:00:00"))
+        self.assertTrue(kwargs["timeMax"].startswith("2030-01-02T23:59:59"))
+        self.assertEqual(kwargs["orderBy"], "startTime")
+        self.assertNotIn("syncToken", kwargs)
+    
+    def test_repeat_query_is_cached(self):
+        """Test that a repeat query is served from the cache until a write"""
+        self.manager.execute("list_events", date="2030-01-02")
+        result = self.manager.execute("list_events", date="2030-01-02")
+        
+        self.assertTrue(result["cached"])
+        self.assertEqual(self.list_call.call_count, 1)
+        
+        # Creating an event drops the calendar's cached listings
+        self.manager.execute("create_event", title="Lunch", date="2030-01-02", time="12:00")
+        result = self.manager.execute("list_events", date="2030-01-02")
+        
+        self.assertNotIn("cached", result)
+        self.assertEqual(self.list_call.call_count, 2)
+
+class TestExecuteBatch(unittest.TestCase):
+    """
+    Test cases for GoogleCalendarManager execute_batch
+    """
+    def setUp(self):
+        self.manager = _make_manager()
+        self.batches = []
+        self.fail_after = None
+        
+        def new_batch(callback):
+            batch = _FakeBatch(callback, self.fail_after)
+            self.batches.append(batch)
+            return batch
+        
+        self.manager.service.new_batch_http_request.side_effect = new_batch
+        self.events = self.manager.service.events.return_value
+        self.events.get.side_effect = lambda calendarId, eventId, fields: _FakeRequest(
+            {"id": eventId, "summary": f"Event {eventId}",
+             "start": {"dateTime": "2030-01-02T10:00:00+00:00"},
+             "end": {"dateTime": "2030-01-02T11:00:00+00:00"}})
+        self.events.insert.side_effect = lambda calendarId, body: _FakeRequest(
+            {"id": "new", "htmlLink": "link", "summary": body["summary"]})
+        self.events.delete.side_effect = lambda calendarId, eventId: _FakeRequest(error=_not_found())
+    
+    def test_results_map_back_to_operations(self):
+        """Test that each response is reported under its operation's client_id"""
+        result = self.manager.execute_batch([
+            {"action": "get_event_details", "client_id": "a", "event_id": "e1"},
+            {"action": "create_event", "client_id": "b", "title": "Lunch", "date": "2030-01-02", "time": "12:00"},
+            {"action": "get_event_details", "event_id": "e2"},
+        ])
+        
+        self.assertEqual(len(self.batches), 1)
+        self.assertEqual(result["results"]["a"]["event"]["id"], "e1")
+        self.assertEqual(result["results"]["b"], {"event_id": "new", "event_link": "link", "title": "Lunch"})
+        # Operations without a client_id are keyed by their position
+        self.assertEqual(result["results"]["2"]["event"]["title"], "Event e2")
+        self.assertEqual(result["count"], 3)
+    
+    def test_partial_failures(self):
+        """Test that failed and invalid operations are reported without affecting the others"""
+        result = self.manager.execute_batch([
+            {"action": "get_event_details", "client_id": "ok", "event_id": "e1"},
+            {"action": "delete_event", "client_id": "missing", "event_id": "gone"},
+            {"action": "create_event", "client_id": "untitled"},
+            {"action": "rename_calendar", "client_id": "unknown"},
+        ])
+        results = result["results"]
+        
+        self.assertIn("event", results["ok"])
+        self.assertEqual(results["missing"], {"error": "Event not found"})
+        self.assertEqual(results["untitled"], {"error": "Event title is required"})
+        self.assertIn("Unsupported batch action", results["unknown"]["error"])
+        self.assertEqual(result["message"], "Batch completed: 1 of 4 operations succeeded")
+        # Only the two valid operations were sent
+        self.assertEqual(len(self.batches[0].requests), 2)
+    
+    def test_large_batches_are_split(self):
+        """Test that more than 50 operations are sent in several batches, keeping their order"""
+        ids = [f"e{index}" for index in range(60)]
+        result = self.manager.execute_batch(
+            [{"action": "get_event_details", "client_id": eid, "event_id": eid} for eid in ids])
+        
+        self.assertEqual([len(batch.requests) for batch in self.batches], [50, 10])
+        self.assertEqual([result["results"][eid]["event"]["id"] for eid in ids], ids)
+    
+    @patch.object(GoogleCalendarManager, '_authorized_http')
+    def test_parallel_fallback(self, mock_http):
+        """Test that requests left over by a failed batch are retried individually"""
+        self.fail_after = 1
+        result = self.manager.execute_batch([
+            {"action": "get_event_details", "client_id": "first", "event_id": "e1"},
+            {"action": "get_event_details", "client_id": "second", "event_id": "e2"},
+            {"action": "delete_event", "client_id": "third", "event_id": "e3"},
+        ])
+        results = result["results"]
+        
+        self.assertEqual(results["first"]["event"]["id"], "e1")
+        self.assertEqual(results["second"]["event"]["id"], "e2")
+        self.assertEqual(results["third"], {"error": "Event not found"})
+        # Every request ran exactly once: the first inside the batch, the rest on the pool
+        self.assertEqual([request.calls for _, request in self.batches[0].requests], [1, 1, 1])
+
+@patch('src.tool_calls.google_calendar._LOCAL_TZ', pytz.UTC)
+class TestFindFreeTime(unittest.TestCase):
+    """
+    Test cases for GoogleCalendarManager find_free_time
+    """
+    def setUp(self):
+        self.manager = _make_manager()
+        self.list_call = self.manager.service.events.return_value.list
+    
+    def _busy(self, *spans):
+        return {"items": [
+            {"start": {"dateTime": f"2030-01-02T{start}:00+00:00"},
+             "end": {"dateTime": f"2030-01-02T{end}:00+00:00"}}
+            for start, end in spans
+        ]}
+    
+    def test_overlapping_and_out_of_bounds_events(self):
+        """Test merging overlapping events and clipping events outside the working day"""
+        self.list_call.return_value.execute.return_value = self._busy(
+            ("06:00", "07:00"),   # entirely before work hours
+            ("08:00", "10:00"),   # starts before work hours
+            ("09:30", "11:00"),   # overlaps the previous event
+            ("10:30", "10:45"),   # nested inside it
+            ("13:00", "14:00"),
+            ("16:30", "18:00"),   # runs past the end of the day's work hours
+        )
+        
+        result = self.manager.execute("find_free_time", date="2030-01-02", duration=30)
+        
+        self.assertEqual(result["free_slots"], [
+            {"start_time": "11:00", "end_time": "13:00", "duration_available": 120},
+            {"start_time": "14:00", "end_time": "16:30", "duration_available": 150},
+        ])
+    
+    def test_duration_filter_and_all_day_events(self):
+        """Test that short gaps are dropped and all-day events do not block time"""
+        busy = self._busy(("09:00", "12:00"), ("12:20", "17:00"))
+        busy["items"].append({"start": {"date": "2030-01-02"}, "end": {"date": "2030-01-03"}})
+        self.list_call.return_value.execute.return_value = busy
+        
+        result = self.manager.execute("find_free_time", date="2030-01-02", duration=30)
+        self.assertEqual(result["free_slots"], [])
+        
+        result = self.manager.execute("find_free_time", date="2030-01-02", duration=15)
+        self.assertEqual(result["free_slots"], [
+            {"start_time": "12:00", "end_time": "12:20", "duration_available": 20},
+        ])
+    
+    def test_busy_times_are_cached(self):
+        """Test that repeat queries for the same day reuse the busy times until a write"""
+        self.list_call.return_value.execute.return_value = self._busy(("09:00", "12:00"))
+        
+        self.manager.execute("find_free_time", date="2030-01-02", duration=30)
+        result = self.manager.execute("find_free_time", date="2030-01-02", duration=60)
+        
+        self.assertEqual(self.list_call.return_value.execute.call_count, 1)
+        self.assertEqual(result["free_slots"][0]["start_time"], "12:00")
+        
+        self.manager.execute("create_event", title="Review", date="2030-01-02", time="13:00")
+        self.manager.execute("find_free_time", date="2030-01-02", duration=30)
+        self.assertEqual(self.list_call.return_value.execute.call_count, 2)
+    
+    def test_empty_day(self):
+        """Test that a day without events is one free slot spanning the working hours"""
+        self.list_call.return_value.execute.return_value = {"items": []}
+        
+        result = self.manager.execute("find_free_time", date="2030-01-02", work_start="10:00", work_end="12:30")
+        
+        self.assertEqual(result["free_slots"], [
+            {"start_time": "10:00", "end_time": "12:30", "duration_available": 150},
+        ])
+
+class TestAsyncGoogleCalendarManager(unittest.TestCase):
+    """
+    Test cases for AsyncGoogleCalendarManager
+    """
+    def setUp(self):
+        self.service = MagicMock()
+        self.list_call = self.service.events.return_value.list
+        self.list_call.return_value.execute.return_value = {
+            "items": [_timed_event("e1", "2030-01-02T10:00:00+00:00", "2030-01-02T11:00:00+00:00")]
+        }
+        patchers = [
+            patch('src.tool_calls.google_calendar.build', return_value=self.service),
+            patch.object(GoogleCalendarManager, '_authorized_http'),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.manager = _make_manager()
+        self.async_manager = AsyncGoogleCalendarManager(self.manager)
+    
+    def test_workers_do_not_share_caches(self):
+        """Test that concurrent calls run on workers with their own caches"""
+        calls = [("list_events", {"date": f"2030-01-{day:02d}"}) for day in range(1, 21)]
+        results = asyncio.run(self.async_manager.execute_many(calls))
+        
+        self.assertEqual(len(results), 20)
+        self.assertTrue(all(result["count"] == 1 for result in results))
+        self.assertEqual([result["date_range"][:10] for result in results],
+                         [f"2030-01-{day:02d}" for day in range(1, 21)])
+        caches = [worker._list_cache for worker in self.async_manager._workers]
+        self.assertEqual(len({id(cache) for cache in caches}), len(caches))
+        self.assertNotIn(id(self.manager._list_cache), {id(cache) for cache in caches})
+        self.assertEqual(self.manager._list_cache, {})
+    
+    def test_write_invalidates_every_worker(self):
+        """Test that a write on one worker drops cached listings on the others"""
+        asyncio.run(self.async_manager.execute_many([("list_events", {"date": "2030-01-02"})] * 8))
+        self.assertTrue(any(worker._list_cache for worker in self.async_manager._workers))
+        
+        result = asyncio.run(self.async_manager.execute(
+            "create_event", title="Lunch", date="2030-01-02", time="12:00"))
+        
+        self.assertNotIn("error", result)
+        self.assertEqual([worker._list_cache for worker in self.async_manager._workers],
+                         [{}] * len(self.async_manager._workers))
+        result = asyncio.run(self.async_manager.execute("list_events", date="2030-01-02"))
+        self.assertNotIn("cached", result)
+    
+    def test_write_invalidates_wrapped_manager(self):
+        """Test that a write through the wrapper drops the wrapped manager's cached listings"""
+        self.manager.service = self.service
+        self.manager.execute("list_events", date="2030-01-02")
+        self.assertIn("cached", self.manager.execute("list_events", date="2030-01-02"))
+        
+        result = asyncio.run(self.async_manager.execute(
+            "create_event", title="Lunch", date="2030-01-02", time="12:00"))
+        
+        self.assertNotIn("error", result)
+        self.assertNotIn("cached", self.manager.execute("list_events", date="2030-01-02"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import unittest
+from unittest.mock import patch
+
+from src.tool_calls.tool_manager import ToolManager
+
+class TestToolManager(unittest.TestCase):
+    """
+    Test cases for ToolManager class
+    """
+    def setUp(self):
+        # Leave Google Calendar out: it needs credentials and network access
+        with patch('src.tool_calls.tool_manager.GoogleCalendarManager', side_effect=Exception("offline")), \
+             patch('builtins.print'):
+            self.manager = ToolManager()
+    
+    def test_parse_complete_tool_call(self):
+        """Test parsing a tool call wrapped in tags"""
+        response = 'Sure.\n<tool_call>\n{"tool_name": "calculator", "parameters": {"expression": "2+2"}}\n</tool_call>'
+        self.assertEqual(self.manager.parse_tool_call(response),
+                         {"tool_name": "calculator", "parameters": {"expression": "2+2"}})
+    
+    def test_parse_unclosed_tool_call(self):
+        """Test that only the first call is taken when the closing tag is missing"""
+        unclosed = '<tool_call>\n{"tool_name": "weather_checker", "parameters": {"location": "Paris"}}\nThanks'
+        self.assertEqual(self.manager.parse_tool_call(unclosed)["parameters"], {"location": "Paris"})
+    
+    def test_parse_concatenated_tool_calls(self):
+        """Test that only the first call is taken when calls are chained"""
+        chained = ('<tool_call>{"tool_name": "calculator", "parameters": {"expression": "1+1"}} and '
+                   '{"tool_name": "calculator", "parameters": {"expression": "2+2"}}</tool_call>')
+        self.assertEqual(self.manager.parse_tool_call(chained)["parameters"], {"expression": "1+1"})
+    
+    def test_parse_bare_and_malformed_calls(self):
+        """Test bare JSON tool calls and calculator calls missing their wrapper"""
+        bare = '{"tool_name": "calculator", "parameters": {"expression": "3*3"}}'
+        self.assertEqual(self.manager.parse_tool_call(bare)["parameters"], {"expression": "3*3"})
+        
+        unwrapped = '<tool_call>{"expression": "sqrt(16)"}</tool_call>'
+        self.assertEqual(self.manager.parse_tool_call(unwrapped),
+                         {"tool_name": "calculator", "parameters": {"expression": "sqrt(16)"}})
+    
+    def test_parse_without_tool_call(self):
+        """Test that plain replies and broken JSON are told apart"""
+        self.assertIsNone(self.manager.parse_tool_call("The capital of France is Paris."))
+        self.assertIn("error", self.manager.parse_tool_call("<tool_call>{not json}</tool_call>"))
+    
+    def test_process_response_strips_tool_call(self):
+        """Test that the spoken text has the tool call removed"""
+        response = ('Let me work that out.\n\n<tool_call>\n{"tool_name": "calculator", '
+                    '"parameters": {"expression": "6*7"}}\n</tool_call>\n\nOne moment.')
+        result = self.manager.process_response_with_tools(response)
+        
+        self.assertEqual(result["type"], "tool_response")
+        self.assertEqual(result["content"], "Let me work that out.\nOne moment.")
+        self.assertEqual(result["tool_result"]["result"]["formatted_result"], "42")
+    
+    def test_unknown_tool(self):
+        """Test executing a tool that is not registered"""
+        result = self.manager.execute_tool_call({"tool_name": "google_calendar", "parameters": {}})
+        self.assertEqual(result, {"error": "Unknown tool: google_calendar"})
+    
+    def test_calculator_results_are_cached(self):
+        """Test that repeat calculator calls are served without re-evaluating"""
+        tool_call = {"tool_name": "calculator", "parameters": {"expression": "2^10"}}
+        with patch('src.tool_calls.tool_manager.Calculator.execute',
+                   return_value={"formatted_result": "1024"}) as mock_execute:
+            first = self.manager.execute_tool_call(tool_call)
+            second = self.manager.execute_tool_call(tool_call)
+        
+        mock_execute.assert_called_once_with(expression="2^10")
+        self.assertEqual(first, second)
+        self.assertTrue(second["success"])
+    
+    def test_cached_results_are_copies(self):
+        """Test that callers modifying a result do not change the cached one"""
+        tool_call = {"tool_name": "calculator", "parameters": {"expression": "x^2 - 4", "mode": "solve"}}
+        first = self.manager.execute_tool_call(tool_call)
+        first["result"]["formatted_result"] = "tampered"
+        first["result"]["result"].append(99)
+        
+        second = self.manager.execute_tool_call(tool_call)
+        second["result"]["result"].clear()
+        third = self.manager.execute_tool_call(tool_call)
+        
+        self.assertEqual(third["result"]["formatted_result"], "-2, 2")
+        self.assertEqual([int(value) for value in third["result"]["result"]], [-2, 2])
+    
+    def test_format_tool_results(self):
+        """Test user-facing formatting per tool and errors"""
+        calculator = self.manager.execute_tool_call({"tool_name": "calculator", "parameters": {"expression": "2+3"}})
+        self.assertEqual(self.manager.format_tool_result_for_user(calculator), "🧮 **2+3 = 5**")
+        
+        error = {"tool_name": "calculator", "result": {"error": "bad input"}, "success": False}
+        self.assertEqual(self.manager.format_tool_result_for_user(error), "❌ bad input")
+        
+        free_time = {"tool_name": "google_calendar", "success": True, "result": {
+            "action": "find_free_time", "date": "2030-01-02", "requested_duration": 30,
+            "free_slots": [{"start_time": "11:00", "end_time": "13:00", "duration_available": 120}]}}
+        self.assertEqual(self.manager.format_tool_result_for_user(free_time),
+                         "📅 Found 1 free slot on 2030-01-02: 11:00 - 13:00 (120 min available)")
+    
+    def test_format_raw_fallback(self):
+        """Test that tools without a formatter fall back to compact JSON"""
+        raw = {"tool_name": "weather_checker", "success": True, "result": {"temperature": 21}}
+        self.assertEqual(self.manager.format_tool_result_for_user(raw), '🔧 weather_checker: {"temperature":21}')
+
+
+if __name__ == '__main__':
+    unittest.main()
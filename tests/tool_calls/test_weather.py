@@ -0,0 +1,90 @@
+import json
+import unittest
+from unittest.mock import patch, MagicMock
+
+import requests
+
+from src.tool_calls import weather
+from src.tool_calls.weather import WeatherChecker
+
+_PARIS = {
+    "location": {"name": "Paris", "country": "France", "region": "Ile-de-France", "localtime": "2030-01-02 10:00"},
+    "current": {
+        "temperature": 12,
+        "feelslike": 10,
+        "weather_descriptions": ["Light rain"],
+        "humidity": 80,
+        "wind_speed": 15,
+        "wind_dir": "SW",
+    },
+}
+
+def _response(payload):
+    response = MagicMock()
+    response.json.return_value = payload
+    response.content = json.dumps(payload).encode()
+    return response
+
+class TestWeatherChecker(unittest.TestCase):
+    """
+    Test cases for WeatherChecker class
+    """
+    def setUp(self):
+        weather._CACHE.clear()
+        patchers = [
+            patch.object(weather, '_API_KEY', "test-key"),
+            patch.object(weather._SESSION, 'get'),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.mock_get = weather._SESSION.get
+        self.addCleanup(weather._CACHE.clear)
+    
+    def test_summary(self):
+        """Test the weather summary and data for a successful response"""
+        self.mock_get.return_value = _response(_PARIS)
+        
+        result = WeatherChecker.execute("Paris", units="f")
+        
+        self.assertTrue(result["success"])
+        self.assertEqual(result["summary"],
+                         "Weather in Paris, France:, 12°F, Light rain, (feels like 10°F), Humidity: 80%, Wind: 15 km/h SW")
+        self.assertEqual(result["data"]["unit_symbol"], "°F")
+        self.assertEqual(self.mock_get.call_args.kwargs["params"]["query"], "Paris")
+    
+    def test_api_errors(self):
+        """Test that weatherstack error codes map to user-facing messages"""
+        self.mock_get.return_value = _response(
+            {"success": False, "error": {"code": 601, "type": "missing_query", "info": "Atlantis"}})
+        self.assertEqual(WeatherChecker.execute("Atlantis")["error"],
+                         "Invalid location 'Atlantis'. Please provide a valid city name or coordinates.")
+        
+        self.mock_get.return_value = _response(
+            {"success": False, "error": {"code": 999, "type": "odd", "info": "Something odd"}})
+        self.assertEqual(WeatherChecker.execute("Nowhere")["error"], "Weather service error: Something odd")
+    
+    def test_missing_location(self):
+        """Test that a missing or blank location returns an error without calling the API"""
+        self.assertIn("error", WeatherChecker.execute(None))
+        self.assertIn("error", WeatherChecker.execute("   "))
+        self.mock_get.assert_not_called()
+    
+    def test_connection_error(self):
+        """Test that network failures are reported, not raised"""
+        self.mock_get.side_effect = requests.ConnectionError("unreachable")
+        self.assertIn("Weather service connection failed", WeatherChecker.execute("Paris")["error"])
+    
+    def test_results_are_cached_as_copies(self):
+        """Test that repeat lookups are cached and callers cannot modify the cached result"""
+        self.mock_get.return_value = _response(_PARIS)
+        
+        first = WeatherChecker.execute("Paris")
+        first["data"]["temperature"] = -40
+        second = WeatherChecker.execute(" paris ")
+        
+        self.mock_get.assert_called_once()
+        self.assertEqual(second["data"]["temperature"], 12)
+
+if __name__ == '__main__':
+    unittest.main()